@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_add_admin_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', '-created_at'], name='users_role_fc4e93_idx'),
+        ),
+    ]
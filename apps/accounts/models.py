@@ -5,6 +5,18 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 
+_AUTHOR = 'AUTHOR'
+_REVIEWER = 'REVIEWER'
+_ADMIN = 'ADMIN'
+
+# Bit encoding of roles, used by permission classes for mask checks.
+ROLE_AUTHOR = 1
+ROLE_REVIEWER = 2
+ROLE_ADMIN = 4
+
+ROLE_BITS = {_AUTHOR: ROLE_AUTHOR, _REVIEWER: ROLE_REVIEWER, _ADMIN: ROLE_ADMIN}
+
+
 class User(AbstractUser):
     """
     Custom User model with role support.
@@ -42,19 +54,29 @@ class User(AbstractUser):
     class Meta:
         db_table = 'users'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            # Role-restricted user pickers (limit_choices_to) in default order
+            models.Index(fields=['role', '-created_at']),
+        ]
     
     def __str__(self):
         return f"{self.email} ({self.get_role_display()})"
     
     @property
     def is_author(self):
-        return self.role == self.Role.AUTHOR
+        return self.role == _AUTHOR
     
     @property
     def is_reviewer(self):
-        return self.role == self.Role.REVIEWER
+        return self.role == _REVIEWER
     
     @property
     def is_admin(self):
-        return self.role == self.Role.ADMIN
+        return self.role == _ADMIN
+    
+    @property
+    def role_bit(self):
+        """Role encoded as a single bit (0 for unknown roles)."""
+        return ROLE_BITS.get(self.role, 0)
 
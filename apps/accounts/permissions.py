@@ -1,71 +1,71 @@
 """
 Role-based permissions for UJMP.
 """
-from rest_framework import permissions
+from functools import lru_cache
 
+from rest_framework import permissions
 
-class IsAuthor(permissions.BasePermission):
-    """Permission class to check if user is an Author."""
-    
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'AUTHOR'
-        )
+from .models import ROLE_ADMIN, ROLE_AUTHOR, ROLE_BITS, ROLE_REVIEWER
 
 
-class IsReviewer(permissions.BasePermission):
-    """Permission class to check if user is a Reviewer."""
-    
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'REVIEWER'
-        )
+MASK_AUTHOR_ADMIN = ROLE_AUTHOR | ROLE_ADMIN
+MASK_REVIEWER_ADMIN = ROLE_REVIEWER | ROLE_ADMIN
+MASK_AUTHOR_REVIEWER_ADMIN = ROLE_AUTHOR | ROLE_REVIEWER | ROLE_ADMIN
 
 
-class IsAdmin(permissions.BasePermission):
-    """Permission class to check if user is an Admin."""
+def _role_bit(request):
+    """
+    Return the authenticated user's role bit, memoized on the request.
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'ADMIN'
-        )
+    DRF evaluates every permission class (and some of them twice when object
+    permissions are checked), so the role is resolved once per request and
+    stored as ``request._ujmp_role_bit``. Anonymous users map to 0.
+    """
+    bit = getattr(request, '_ujmp_role_bit', None)
+    if bit is None:
+        user = request.user
+        if user and user.is_authenticated:
+            bit = getattr(user, 'role_bit', 0)
+        else:
+            bit = 0
+        request._ujmp_role_bit = bit
+    return bit
 
 
-class IsAuthorOrAdmin(permissions.BasePermission):
-    """Permission class to check if user is Author or Admin."""
+def role_required(*roles):
+    """
+    Build a permission class granting access to users with any of ``roles``.
     
-    def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.role in ['AUTHOR', 'ADMIN']
-        )
+    Usage: ``permission_classes = [role_required('AUTHOR', 'ADMIN')]``.
+    The role set and its bitmask are computed once per distinct role set.
+    """
+    return _role_required(frozenset(roles))
 
 
-class IsReviewerOrAdmin(permissions.BasePermission):
-    """Permission class to check if user is Reviewer or Admin."""
+@lru_cache(maxsize=None)
+def _role_required(roles):
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS[role]
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role in ['REVIEWER', 'ADMIN']
-        )
-
-
-class IsAuthorOrReviewerOrAdmin(permissions.BasePermission):
-    """Permission class to check if user is Author, Reviewer, or Admin."""
+    class RolePermission(permissions.BasePermission):
+        _ROLES = roles
+        _MASK = mask
+        
+        def has_permission(self, request, view):
+            return bool(_role_bit(request) & mask)
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role in ['AUTHOR', 'REVIEWER', 'ADMIN']
-        )
+    ordered = sorted(roles, key=ROLE_BITS.__getitem__)
+    RolePermission.__name__ = RolePermission.__qualname__ = (
+        'Is' + 'Or'.join(role.title() for role in ordered)
+    )
+    RolePermission.__doc__ = f"Permission class to check if user is {' or '.join(ordered)}."
+    return RolePermission
+
 
+IsAuthor = role_required('AUTHOR')
+IsReviewer = role_required('REVIEWER')
+IsAdmin = role_required('ADMIN')
+IsAuthorOrAdmin = role_required('AUTHOR', 'ADMIN')
+IsReviewerOrAdmin = role_required('REVIEWER', 'ADMIN')
+IsAuthorOrReviewerOrAdmin = role_required('AUTHOR', 'REVIEWER', 'ADMIN')
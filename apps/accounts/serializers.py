@@ -4,9 +4,14 @@ Serializers for authentication and user management.
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
 from .models import User
 
 
+JWT_CLAIMS_CACHE_KEY = 'ujmp:jwt_claims:{pk}'
+JWT_CLAIMS_CACHE_TIMEOUT = 300  # seconds
+
+
 class UserSerializer(serializers.ModelSerializer):
     """User serializer for profile and list views."""
     
@@ -17,6 +22,28 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class UserListSerializer(serializers.Serializer):
+    """
+    Read-only user serializer for list and nested read paths.
+    
+    Plain fields avoid ModelSerializer field introspection; accepts model
+    instances or ``User.objects.values(*UserListSerializer.VALUES)`` rows.
+    """
+    VALUES = ('id', 'email', 'username', 'role', 'first_name', 'last_name',
+              'phone', 'affiliation', 'is_active', 'created_at')
+    
+    id = serializers.IntegerField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    username = serializers.CharField(read_only=True)
+    role = serializers.CharField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    phone = serializers.CharField(read_only=True)
+    affiliation = serializers.CharField(read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
     
@@ -52,7 +79,12 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        token['role'] = user.role
-        token['email'] = user.email
+        claims = cache.get_or_set(
+            JWT_CLAIMS_CACHE_KEY.format(pk=user.pk),
+            lambda: {'role': user.role, 'email': user.email},
+            JWT_CLAIMS_CACHE_TIMEOUT
+        )
+        token['role'] = claims['role']
+        token['email'] = claims['email']
         return token
 
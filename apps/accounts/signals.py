@@ -0,0 +1,22 @@
+"""
+Signals for user lifecycle events.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import User
+from .serializers import JWT_CLAIMS_CACHE_KEY
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_jwt_claims(sender, instance, **kwargs):
+    """
+    Drop cached JWT claims so the next token reflects the current role/email.
+    
+    Saves that only touch ``last_login`` (issued on every login) keep the cache.
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    cache.delete(JWT_CLAIMS_CACHE_KEY.format(pk=instance.pk))
@@ -1,9 +1,75 @@
 from django.contrib import admin
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from .models import Article, ArticleVersion, Review
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections, transaction
+from django.db.models import Q
+from .models import Article, ArticleAuthor, ArticleVersion, Review
 from .services import ArticleWorkflowService
-from .workflow import ArticleStatus, get_allowed_transitions
+from .workflow import ALLOWED_TRANSITION_VALUES, ArticleStatus
+
+
+# Allowed ADMIN transitions per status, rendered once for the changelist.
+_ADMIN_TRANSITION_LABELS = {
+    status.value: (
+        ', '.join(ALLOWED_TRANSITION_VALUES[(status.value, 'ADMIN')])
+        or 'No transitions available (terminal state or requires different role)'
+    )
+    for status in ArticleStatus
+}
+
+
+def _make_action(service_method, *args, short_description, success_message, error_message):
+    """
+    Build an ArticleAdmin bulk action calling ``ArticleWorkflowService.<service_method>``.
+    
+    Extra positional ``args`` are passed after ``(article, user)``.
+    """
+    def action(modeladmin, request, queryset):
+        modeladmin._bulk_workflow(
+            request, queryset, getattr(ArticleWorkflowService, service_method), *args,
+            success_message=success_message,
+            error_message=error_message,
+        )
+    action.short_description = short_description
+    return action
+
+
+def _make_set_action(service_method, *args, short_description, success_message, error_message):
+    """
+    Build an ArticleAdmin bulk action calling the set-based
+    ``ArticleWorkflowService.<service_method>(pks, user, *args)``.
+    
+    The service method returns the pks it processed; the rest of the
+    selection is reported as skipped.
+    """
+    def action(modeladmin, request, queryset):
+        modeladmin._set_workflow(
+            request, queryset, getattr(ArticleWorkflowService, service_method), *args,
+            success_message=success_message,
+            error_message=error_message,
+        )
+    action.short_description = short_description
+    return action
+
+
+# Workflow actions exposed to superadmins only (see ArticleAdmin.get_actions).
+_WORKFLOW_ACTIONS = frozenset({
+    'admin_send_to_review',
+    'admin_request_revision',
+    'admin_accept_article',
+    'admin_reject_article',
+    'admin_desk_reject',
+    'admin_move_to_production',
+    'admin_publish_article',
+})
+
+
+class ArticleAuthorInline(admin.TabularInline):
+    """Inline admin for article authors."""
+    model = ArticleAuthor
+    extra = 0
+    fields = ('ordinal', 'name', 'affiliation', 'email', 'orcid')
 
 
 class ArticleVersionInline(admin.TabularInline):
@@ -28,7 +94,8 @@ class ArticleAdmin(admin.ModelAdmin):
     list_filter = ('status', 'payment_status', 'journal', 'created_at')
     search_fields = ('submission_id', 'title', 'corresponding_author__email')
     readonly_fields = ('submission_id', 'status', 'payment_status', 'allowed_transitions_display', 'created_at', 'updated_at', 'submitted_at')
-    inlines = [ArticleVersionInline, ReviewInline]
+    inlines = [ArticleAuthorInline, ArticleVersionInline, ReviewInline]
+    workflow_chunk_size = 200  # Articles loaded per batch by bulk workflow actions
     actions = [
         'admin_send_to_review',
         'admin_request_revision',
@@ -43,7 +110,7 @@ class ArticleAdmin(admin.ModelAdmin):
             'fields': ('submission_id', 'title', 'abstract', 'keywords', 'journal')
         }),
         ('Authors', {
-            'fields': ('corresponding_author', 'authors')
+            'fields': ('corresponding_author',)
         }),
         ('Scientific Workflow', {
             'fields': ('status', 'submitted_at', 'allowed_transitions_display'),
@@ -65,207 +132,158 @@ class ArticleAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related and prefetch_related."""
+        """Load only the columns the changelist renders."""
         qs = super().get_queryset(request)
-        return qs.select_related('journal', 'corresponding_author').prefetch_related('versions', 'reviews')
+        return qs.select_related('journal', 'corresponding_author').only(
+            'id', 'submission_id', 'title', 'status', 'payment_status', 'created_at',
+            'journal__name', 'corresponding_author__email', 'corresponding_author__role',
+        )
+    
+    def get_object(self, request, object_id, from_field=None):
+        """Load the full row for the change form (inlines query their own rows)."""
+        queryset = super().get_queryset(request).select_related('journal', 'corresponding_author')
+        model = queryset.model
+        field = model._meta.pk if from_field is None else model._meta.get_field(from_field)
+        try:
+            object_id = field.to_python(object_id)
+            return queryset.get(**{field.name: object_id})
+        except (model.DoesNotExist, ValidationError, ValueError):
+            return None
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Use the GIN-indexed full-text vector on PostgreSQL, ILIKE elsewhere."""
+        search_term = search_term.strip()
+        if not search_term or connections[queryset.db].vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        query = SearchQuery(search_term, search_type='websearch')
+        return queryset.filter(Q(search_vector=query) | Q(submission_id__iexact=search_term)), False
     
     def allowed_transitions_display(self, obj):
         """Display allowed workflow transitions for current status and admin role."""
         if not obj:
             return '-'
-        current_status = ArticleStatus(obj.status)
-        allowed = get_allowed_transitions(current_status, 'ADMIN')
-        if not allowed:
-            return 'No transitions available (terminal state or requires different role)'
-        return ', '.join([s.value for s in allowed])
+        return _ADMIN_TRANSITION_LABELS.get(obj.status, '-')
     allowed_transitions_display.short_description = 'Allowed Transitions (Admin)'
     
     def get_actions(self, request):
         """Restrict workflow actions to superadmins only."""
         actions = super().get_actions(request)
         if not request.user.is_superuser:
-            # Remove workflow actions for non-superusers
-            workflow_actions = [
-                'admin_send_to_review',
-                'admin_request_revision',
-                'admin_accept_article',
-                'admin_reject_article',
-                'admin_desk_reject',
-                'admin_move_to_production',
-                'admin_publish_article',
-            ]
-            for action_name in workflow_actions:
-                actions.pop(action_name, None)
+            return {name: action for name, action in actions.items() if name not in _WORKFLOW_ACTIONS}
         return actions
     
-    # Workflow Actions (superadmin only)
-    def admin_send_to_review(self, request, queryset):
-        """Send articles to review (DESK_CHECK → UNDER_REVIEW)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
+    def _bulk_workflow(self, request, queryset, service_method, *args, success_message, error_message):
+        """
+        Apply a workflow service method to every selected article.
         
-        service = ArticleWorkflowService()
+        Rows are locked with SELECT ... FOR UPDATE inside a single transaction
+        and loaded ``workflow_chunk_size`` at a time, so selecting "all" on a
+        large changelist keeps a bounded number of articles in memory. Each
+        article runs in its own savepoint so one failure does not roll back
+        the others.
+        """
         success_count = 0
         error_count = 0
         
-        for article in queryset:
-            try:
-                service.send_to_review(article, request.user)
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
+        with transaction.atomic():
+            pks = list(queryset.values_list('pk', flat=True))
+            locked = (
+                self.model._default_manager
+                .select_related('journal', 'corresponding_author')
+                .select_for_update(of=('self',))
+                .order_by('pk')
+            )
+            for start in range(0, len(pks), self.workflow_chunk_size):
+                for article in locked.filter(pk__in=pks[start:start + self.workflow_chunk_size]):
+                    try:
+                        with transaction.atomic():
+                            service_method(article, request.user, *args)
+                        success_count += 1
+                    except ValidationError as e:
+                        self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
+                        error_count += 1
         
         if success_count > 0:
-            self.message_user(request, f"Successfully sent {success_count} article(s) to review.", level=messages.SUCCESS)
+            self.message_user(request, success_message.format(count=success_count), level=messages.SUCCESS)
         if error_count > 0:
-            self.message_user(request, f"Failed to send {error_count} article(s) to review.", level=messages.ERROR)
-    admin_send_to_review.short_description = "Send to review (DESK_CHECK → UNDER_REVIEW)"
+            self.message_user(request, error_message.format(count=error_count), level=messages.ERROR)
     
-    def admin_request_revision(self, request, queryset):
-        """Request revision (UNDER_REVIEW → REVISION_REQUIRED)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
+    def _set_workflow(self, request, queryset, service_method, *args, success_message, error_message):
+        """
+        Apply a set-based workflow service method to the whole selection.
         
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.request_revision(article, request.user, 'MAJOR', 'Revision requested via admin panel')
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully requested revision for {success_count} article(s).", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to request revision for {error_count} article(s).", level=messages.ERROR)
-    admin_request_revision.short_description = "Request revision (UNDER_REVIEW → REVISION_REQUIRED)"
-    
-    def admin_accept_article(self, request, queryset):
-        """Accept articles (UNDER_REVIEW → ACCEPTED, creates invoice if APC required)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
+        The service locks and updates the eligible rows itself in one
+        transaction; selected articles it did not process are counted in
+        ``error_message``.
+        """
+        pks = list(queryset.values_list('pk', flat=True))
+        try:
+            processed = service_method(pks, request.user, *args)
+        except ValidationError as e:
+            self.message_user(request, str(e), level=messages.ERROR)
             return
         
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.accept_article(article, request.user, 'Article accepted via admin panel')
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully accepted {success_count} article(s). Invoice created if APC required.", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to accept {error_count} article(s).", level=messages.ERROR)
-    admin_accept_article.short_description = "Accept article (UNDER_REVIEW → ACCEPTED)"
+        if processed:
+            self.message_user(request, success_message.format(count=len(processed)), level=messages.SUCCESS)
+        skipped = len(pks) - len(processed)
+        if skipped:
+            self.message_user(request, error_message.format(count=skipped), level=messages.ERROR)
     
-    def admin_reject_article(self, request, queryset):
-        """Reject articles (UNDER_REVIEW → REJECTED)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
-        
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.reject_article(article, request.user, 'Article rejected via admin panel')
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully rejected {success_count} article(s).", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to reject {error_count} article(s).", level=messages.ERROR)
-    admin_reject_article.short_description = "Reject article (UNDER_REVIEW → REJECTED)"
+    # Workflow Actions (superadmin only)
+    admin_send_to_review = _make_action(
+        'send_to_review',
+        short_description="Send to review (DESK_CHECK → UNDER_REVIEW)",
+        success_message="Successfully sent {count} article(s) to review.",
+        error_message="Failed to send {count} article(s) to review.",
+    )
     
-    def admin_desk_reject(self, request, queryset):
-        """Desk reject articles (DESK_CHECK/SUBMITTED → REJECTED)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
-        
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.desk_reject(article, request.user, 'Desk rejected via admin panel')
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully desk rejected {success_count} article(s).", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to desk reject {error_count} article(s).", level=messages.ERROR)
-    admin_desk_reject.short_description = "Desk reject (DESK_CHECK/SUBMITTED → REJECTED)"
+    admin_request_revision = _make_action(
+        'request_revision', 'MAJOR', 'Revision requested via admin panel',
+        short_description="Request revision (UNDER_REVIEW → REVISION_REQUIRED)",
+        success_message="Successfully requested revision for {count} article(s).",
+        error_message="Failed to request revision for {count} article(s).",
+    )
     
-    def admin_move_to_production(self, request, queryset):
-        """Move articles to production (ACCEPTED → PRODUCTION, requires payment gate)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
-        
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.move_to_production(article, request.user)
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully moved {success_count} article(s) to production.", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to move {error_count} article(s) to production. Check payment status.", level=messages.ERROR)
-    admin_move_to_production.short_description = "Move to production (ACCEPTED → PRODUCTION, payment gate)"
+    admin_accept_article = _make_set_action(
+        'accept_many', 'Article accepted via admin panel',
+        short_description="Accept article (UNDER_REVIEW → ACCEPTED)",
+        success_message="Successfully accepted {count} article(s). Invoice created if APC required.",
+        error_message=(
+            "Failed to accept {count} article(s): only UNDER_REVIEW or REVISED_SUBMITTED articles "
+            "you have not already reviewed can be accepted."
+        ),
+    )
     
-    def admin_publish_article(self, request, queryset):
-        """Publish articles (ACCEPTED/PRODUCTION → PUBLISHED, requires payment gate)."""
-        if not request.user.is_superuser:
-            self.message_user(request, "Only superadmins can perform workflow actions.", level=messages.ERROR)
-            return
-        
-        service = ArticleWorkflowService()
-        success_count = 0
-        error_count = 0
-        
-        for article in queryset:
-            try:
-                service.publish_article(article, request.user, publication_url='')
-                success_count += 1
-            except ValidationError as e:
-                self.message_user(request, f"Article {article.submission_id}: {str(e)}", level=messages.ERROR)
-                error_count += 1
-        
-        if success_count > 0:
-            self.message_user(request, f"Successfully published {success_count} article(s).", level=messages.SUCCESS)
-        if error_count > 0:
-            self.message_user(request, f"Failed to publish {error_count} article(s). Check payment status.", level=messages.ERROR)
-    admin_publish_article.short_description = "Publish article (ACCEPTED/PRODUCTION → PUBLISHED, payment gate)"
+    admin_reject_article = _make_action(
+        'reject_article', 'Article rejected via admin panel',
+        short_description="Reject article (UNDER_REVIEW → REJECTED)",
+        success_message="Successfully rejected {count} article(s).",
+        error_message="Failed to reject {count} article(s).",
+    )
+    
+    admin_desk_reject = _make_set_action(
+        'desk_reject_many', 'Desk rejected via admin panel',
+        short_description="Desk reject (DESK_CHECK/SUBMITTED → REJECTED)",
+        success_message="Successfully desk rejected {count} article(s).",
+        error_message=(
+            "Failed to desk reject {count} article(s): only DESK_CHECK or SUBMITTED articles "
+            "you have not already reviewed can be desk rejected."
+        ),
+    )
+    
+    admin_move_to_production = _make_action(
+        'move_to_production',
+        short_description="Move to production (ACCEPTED → PRODUCTION, payment gate)",
+        success_message="Successfully moved {count} article(s) to production.",
+        error_message="Failed to move {count} article(s) to production. Check payment status.",
+    )
+    
+    admin_publish_article = _make_action(
+        'publish_article', '',
+        short_description="Publish article (ACCEPTED/PRODUCTION → PUBLISHED, payment gate)",
+        success_message="Successfully published {count} article(s).",
+        error_message="Failed to publish {count} article(s). Check payment status.",
+    )
 
 
 @admin.register(ArticleVersion)
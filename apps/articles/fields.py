@@ -0,0 +1,67 @@
+"""
+Custom model fields for articles.
+"""
+from enum import Enum
+
+from django.core import exceptions
+from django.db import models
+
+
+class CodedChoiceField(models.PositiveSmallIntegerField):
+    """
+    Choice field stored as a small integer but exposed as its string code.
+    
+    ``codes`` maps each string value (e.g. 'DRAFT') to its stored integer.
+    Python code, serializers, filters and admin keep working with the string
+    values; only the database column (and its indexes) hold the integers.
+    Codes must never be renumbered once data exists.
+    """
+    
+    def __init__(self, *args, codes, **kwargs):
+        self.codes = dict(codes)
+        self.values_by_code = {number: value for value, number in self.codes.items()}
+        super().__init__(*args, **kwargs)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['codes'] = self.codes
+        return name, path, args, kwargs
+    
+    @property
+    def validators(self):
+        # Integer range validators do not apply: the Python value is a string.
+        return list(self._validators)
+    
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.values_by_code[value]
+    
+    def to_python(self, value):
+        if value is None:
+            return value
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, str) and value in self.codes:
+            return value
+        try:
+            return self.values_by_code[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise exceptions.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+    
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return value
+        if isinstance(value, Enum):
+            value = value.value
+        try:
+            return self.codes[value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"Field '{self.name}' expected one of {sorted(self.codes)} but got {value!r}."
+            )
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_add_payment_status'),
+        ('journals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_at'], name='articles_created_58fbe5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', 'payment_status'], name='articles_status_6004e0_idx'),
+        ),
+    ]
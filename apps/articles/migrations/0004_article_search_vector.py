@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:41
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+CREATE_INDEX_SQL = 'CREATE INDEX IF NOT EXISTS articles_search_vector_gin ON articles USING gin (search_vector)'
+DROP_INDEX_SQL = 'DROP INDEX IF EXISTS articles_search_vector_gin'
+
+BACKFILL_SQL = """
+UPDATE articles AS a
+SET search_vector = to_tsvector(
+    COALESCE(a.submission_id, '') || ' ' || COALESCE(a.title, '') || ' ' || COALESCE(u.email, '')
+)
+FROM users AS u
+WHERE u.id = a.corresponding_author_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    """Create the GIN index and backfill vectors (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_INDEX_SQL)
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_add_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_search_vector'),
+        ('journals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_corresp_0e944c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_journal_a78b76_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['corresponding_author', 'status', '-created_at'], name='art_author_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['journal', 'status', '-created_at'], name='art_journal_status_created_idx'),
+        ),
+    ]
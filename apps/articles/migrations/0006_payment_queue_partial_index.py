@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_list_ordering_indexes'),
+        ('journals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('payment_status__in', ['PENDING', 'PAID'])), fields=['payment_status', 'status'], name='art_paid_ready_idx'),
+        ),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:50
+
+import apps.articles.fields
+from django.db import migrations, models
+
+
+STATUS_CODES = {
+    'DRAFT': 1, 'SUBMITTED': 2, 'DESK_CHECK': 3, 'REVIEWERS_INVITED': 4,
+    'UNDER_REVIEW': 5, 'REVISION_REQUIRED': 6, 'REVISED_SUBMITTED': 7,
+    'EDITOR_DECISION': 8, 'ACCEPTED': 9, 'PAYMENT_PENDING': 10, 'PAID': 11,
+    'PRODUCTION': 12, 'SCHEDULED': 13, 'PUBLISHED': 14,
+    'CERTIFICATE_ISSUED': 15, 'REJECTED': 16, 'ARCHIVED': 17,
+}
+PAYMENT_STATUS_CODES = {'NONE': 0, 'PENDING': 1, 'PAID': 2, 'NOT_REQUIRED': 3}
+RECOMMENDATION_CODES = {'ACCEPT': 1, 'REVISE': 2, 'REJECT': 3}
+
+# (model, character column, temporary integer column, codes)
+CONVERSIONS = [
+    ('Article', 'status', 'status_code', STATUS_CODES),
+    ('Article', 'payment_status', 'payment_status_code', PAYMENT_STATUS_CODES),
+    ('Review', 'recommendation', 'recommendation_code', RECOMMENDATION_CODES),
+]
+
+
+def copy_to_codes(apps, schema_editor):
+    """One UPDATE per choice value; rows never pass through Python."""
+    for model_name, old, new, codes in CONVERSIONS:
+        model = apps.get_model('articles', model_name)
+        for value in codes:
+            model.objects.filter(**{old: value}).update(**{new: value})
+
+
+def copy_from_codes(apps, schema_editor):
+    for model_name, old, new, codes in CONVERSIONS:
+        model = apps.get_model('articles', model_name)
+        for value in codes:
+            model.objects.filter(**{new: value}).update(**{old: value})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_payment_queue_partial_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_status_a4f178_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='art_author_status_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='art_journal_status_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_status_6004e0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='art_paid_ready_idx',
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='status_code',
+            field=apps.articles.fields.CodedChoiceField(codes=STATUS_CODES, null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='payment_status_code',
+            field=apps.articles.fields.CodedChoiceField(codes=PAYMENT_STATUS_CODES, null=True),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='recommendation_code',
+            field=apps.articles.fields.CodedChoiceField(codes=RECOMMENDATION_CODES, null=True),
+        ),
+        migrations.RunPython(copy_to_codes, copy_from_codes),
+        # Gives the re-added column a fill value when this migration is reversed.
+        migrations.AlterField(
+            model_name='review',
+            name='recommendation',
+            field=models.CharField(choices=[('ACCEPT', 'Accept'), ('REVISE', 'Revise'), ('REJECT', 'Reject')], default='REVISE', max_length=20),
+        ),
+        migrations.RemoveField(
+            model_name='article',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='article',
+            name='payment_status',
+        ),
+        migrations.RemoveField(
+            model_name='review',
+            name='recommendation',
+        ),
+        migrations.RenameField(
+            model_name='article',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='article',
+            old_name='payment_status_code',
+            new_name='payment_status',
+        ),
+        migrations.RenameField(
+            model_name='review',
+            old_name='recommendation_code',
+            new_name='recommendation',
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='payment_status',
+            field=apps.articles.fields.CodedChoiceField(choices=[('NONE', 'None'), ('PENDING', 'Pending'), ('PAID', 'Paid'), ('NOT_REQUIRED', 'Not Required')], codes=PAYMENT_STATUS_CODES, default='NONE', help_text='Payment status separate from article scientific workflow'),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='status',
+            field=apps.articles.fields.CodedChoiceField(choices=[('DRAFT', 'DRAFT'), ('SUBMITTED', 'SUBMITTED'), ('DESK_CHECK', 'DESK_CHECK'), ('REVIEWERS_INVITED', 'REVIEWERS_INVITED'), ('UNDER_REVIEW', 'UNDER_REVIEW'), ('REVISION_REQUIRED', 'REVISION_REQUIRED'), ('REVISED_SUBMITTED', 'REVISED_SUBMITTED'), ('EDITOR_DECISION', 'EDITOR_DECISION'), ('ACCEPTED', 'ACCEPTED'), ('PAYMENT_PENDING', 'PAYMENT_PENDING'), ('PAID', 'PAID'), ('PRODUCTION', 'PRODUCTION'), ('SCHEDULED', 'SCHEDULED'), ('PUBLISHED', 'PUBLISHED'), ('CERTIFICATE_ISSUED', 'CERTIFICATE_ISSUED'), ('REJECTED', 'REJECTED'), ('ARCHIVED', 'ARCHIVED')], codes=STATUS_CODES, default='DRAFT'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='recommendation',
+            field=apps.articles.fields.CodedChoiceField(choices=[('ACCEPT', 'Accept'), ('REVISE', 'Revise'), ('REJECT', 'Reject')], codes=RECOMMENDATION_CODES),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status'], name='articles_status_a4f178_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['corresponding_author', 'status', '-created_at'], name='art_author_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['journal', 'status', '-created_at'], name='art_journal_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', 'payment_status'], name='articles_status_6004e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('payment_status__in', ['PENDING', 'PAID'])), fields=['payment_status', 'status'], name='art_paid_ready_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:52
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_latest_version_number(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    ArticleVersion = apps.get_model('articles', 'ArticleVersion')
+    latest = ArticleVersion.objects.filter(
+        article=OuterRef('pk')
+    ).order_by().values('article').annotate(
+        latest=Max('version_number')
+    ).values('latest')
+    Article.objects.update(latest_version_number=Coalesce(Subquery(latest), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_integer_choice_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='latest_version_number',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_latest_version_number, migrations.RunPython.noop),
+    ]
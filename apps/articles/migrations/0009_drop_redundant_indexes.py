@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_article_latest_version_number'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_submiss_610345_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_status_a4f178_idx',
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+AUTHOR_FIELD_LENGTHS = {'name': 255, 'affiliation': 500, 'email': 254, 'orcid': 19}
+
+
+def copy_authors_to_table(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    ArticleAuthor = apps.get_model('articles', 'ArticleAuthor')
+    batch = []
+    for article_id, authors in Article.objects.values_list('id', 'authors').iterator():
+        for ordinal, author in enumerate(authors or []):
+            if not isinstance(author, dict):
+                author = {'name': author}
+            batch.append(ArticleAuthor(
+                article_id=article_id,
+                ordinal=ordinal,
+                **{
+                    field: str(author.get(field) or '')[:length]
+                    for field, length in AUTHOR_FIELD_LENGTHS.items()
+                }
+            ))
+        if len(batch) >= 1000:
+            ArticleAuthor.objects.bulk_create(batch)
+            batch = []
+    ArticleAuthor.objects.bulk_create(batch)
+
+
+def copy_authors_to_json(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    ArticleAuthor = apps.get_model('articles', 'ArticleAuthor')
+    authors_by_article = {}
+    for row in ArticleAuthor.objects.order_by('article_id', 'ordinal').values(
+        'article_id', *AUTHOR_FIELD_LENGTHS
+    ):
+        article_id = row.pop('article_id')
+        authors_by_article.setdefault(article_id, []).append(row)
+    articles = list(Article.objects.filter(pk__in=authors_by_article))
+    for article in articles:
+        article.authors = authors_by_article[article.pk]
+    Article.objects.bulk_update(articles, ['authors'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleAuthor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ordinal', models.PositiveSmallIntegerField(help_text='Position in the author list')),
+                ('name', models.CharField(max_length=255)),
+                ('affiliation', models.CharField(blank=True, max_length=500)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('orcid', models.CharField(blank=True, help_text='ORCID iD (0000-0000-0000-0000)', max_length=19)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_authors', to='articles.article')),
+            ],
+            options={
+                'db_table': 'article_authors',
+                'ordering': ['ordinal'],
+                'indexes': [models.Index(fields=['email'], name='article_aut_email_f6b46f_idx')],
+                'unique_together': {('article', 'ordinal')},
+            },
+        ),
+        migrations.RunPython(copy_authors_to_table, copy_authors_to_json),
+        migrations.RemoveField(
+            model_name='article',
+            name='authors',
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_article_authors_table'),
+        ('journals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['corresponding_author', '-created_at'], name='art_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['journal', 'status', '-updated_at'], name='art_journal_status_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:10
+
+from django.db import migrations
+
+
+BACKFILL_SQL = """
+UPDATE articles AS a
+SET search_vector = to_tsvector(
+    COALESCE(a.submission_id, '') || ' ' || COALESCE(a.title, '') || ' ' || COALESCE(a.keywords, '')
+    || ' ' || COALESCE(u.email, '')
+    || ' ' || COALESCE(
+        (SELECT string_agg(aa.name, ' ') FROM article_authors AS aa WHERE aa.article_id = a.id), ''
+    )
+)
+FROM users AS u
+WHERE u.id = a.corresponding_author_id
+"""
+
+
+def backfill_search_vector(apps, schema_editor):
+    """Re-index existing articles with their keywords and byline names (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(BACKFILL_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_article_list_order_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,19 @@
 """
 Article models with strict workflow state machine.
 """
-from django.db import models
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import OuterRef, Subquery
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from datetime import datetime
-import string
-import random
+from datetime import date, datetime
+from functools import lru_cache
+import base64
+import os
+from .fields import CodedChoiceField
 from .workflow import (
+    STATUS_BY_VALUE,
     ArticleStatus,
     can_transition,
     can_publish,
@@ -15,13 +21,75 @@ from .workflow import (
 )
 
 
+STATUS_CHOICES = tuple((status.value, status.name) for status in ArticleStatus)
+
+# Stored integer codes for the enum-valued columns (never renumber).
+STATUS_CODES = {
+    'DRAFT': 1,
+    'SUBMITTED': 2,
+    'DESK_CHECK': 3,
+    'REVIEWERS_INVITED': 4,
+    'UNDER_REVIEW': 5,
+    'REVISION_REQUIRED': 6,
+    'REVISED_SUBMITTED': 7,
+    'EDITOR_DECISION': 8,
+    'ACCEPTED': 9,
+    'PAYMENT_PENDING': 10,
+    'PAID': 11,
+    'PRODUCTION': 12,
+    'SCHEDULED': 13,
+    'PUBLISHED': 14,
+    'CERTIFICATE_ISSUED': 15,
+    'REJECTED': 16,
+    'ARCHIVED': 17,
+}
+
+PAYMENT_STATUS_CODES = {'NONE': 0, 'PENDING': 1, 'PAID': 2, 'NOT_REQUIRED': 3}
+
+RECOMMENDATION_CODES = {'ACCEPT': 1, 'REVISE': 2, 'REJECT': 3}
+
+PAYMENT_STATUS_CHOICES = (
+    ('NONE', 'None'),
+    ('PENDING', 'Pending'),
+    ('PAID', 'Paid'),
+    ('NOT_REQUIRED', 'Not Required'),
+)
+
+REVISION_TYPE_CHOICES = (
+    ('INITIAL', 'Initial Submission'),
+    ('MINOR', 'Minor Revision'),
+    ('MAJOR', 'Major Revision'),
+)
+
+RECOMMENDATION_CHOICES = (
+    ('ACCEPT', 'Accept'),
+    ('REVISE', 'Revise'),
+    ('REJECT', 'Reject'),
+)
+
+
+# Columns written by Article.transition_status.
+TRANSITION_UPDATE_FIELDS = ('status', 'updated_at', 'submitted_at')
+
+SUBMISSION_ID_SUFFIX_LENGTH = 10
+SUBMISSION_ID_MAX_ATTEMPTS = 3
+
+
+@lru_cache(maxsize=1)
+def _submission_date(ordinal: int) -> str:
+    """YYYYMMDD for a date ordinal (cached; the date changes once a day)."""
+    return date.fromordinal(ordinal).strftime('%Y%m%d')
+
+
 def generate_submission_id() -> str:
     """
     Generate unique submission identifier.
-    Format: SUB-YYYYMMDD-XXXXXX (e.g., SUB-20240115-A3B2C1)
+    Format: SUB-YYYYMMDD-XXXXXXXXXX (e.g., SUB-20240115-A3B2C7D4E5)
+    
+    The suffix is base32 over kernel randomness (os.urandom), 50 bits.
     """
-    date_str = datetime.now().strftime('%Y%m%d')
-    random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    date_str = _submission_date(datetime.now().toordinal())
+    random_suffix = base64.b32encode(os.urandom(8))[:SUBMISSION_ID_SUFFIX_LENGTH].decode()
     return f"SUB-{date_str}-{random_suffix}"
 
 
@@ -45,17 +113,13 @@ class Article(models.Model):
     abstract = models.TextField()
     keywords = models.CharField(max_length=500, blank=True)
     
-    # Authors
+    # Authors (co-author list lives in ArticleAuthor)
     corresponding_author = models.ForeignKey(
         'accounts.User',
         on_delete=models.CASCADE,
         related_name='authored_articles',
         limit_choices_to={'role': 'AUTHOR'}
     )
-    authors = models.JSONField(
-        default=list,
-        help_text='List of authors with affiliations'
-    )
     
     # Journal
     journal = models.ForeignKey(
@@ -65,21 +129,16 @@ class Article(models.Model):
     )
     
     # Workflow Status (Scientific Lifecycle)
-    status = models.CharField(
-        max_length=30,
-        choices=[(status.value, status.name) for status in ArticleStatus],
+    status = CodedChoiceField(
+        codes=STATUS_CODES,
+        choices=STATUS_CHOICES,
         default=ArticleStatus.DRAFT.value
     )
     
     # Payment Status (Business Lifecycle)
-    payment_status = models.CharField(
-        max_length=20,
-        choices=[
-            ('NONE', 'None'),
-            ('PENDING', 'Pending'),
-            ('PAID', 'Paid'),
-            ('NOT_REQUIRED', 'Not Required'),
-        ],
+    payment_status = CodedChoiceField(
+        codes=PAYMENT_STATUS_CODES,
+        choices=PAYMENT_STATUS_CHOICES,
         default='NONE',
         help_text='Payment status separate from article scientific workflow'
     )
@@ -97,14 +156,29 @@ class Article(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     submitted_at = models.DateTimeField(blank=True, null=True)
     
+    # Highest ArticleVersion.version_number issued (see next_version_number)
+    latest_version_number = models.PositiveIntegerField(default=0, editable=False)
+    
+    # Full-text search (PostgreSQL only; GIN-indexed, see refresh_search_vector)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     class Meta:
         db_table = 'articles'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['submission_id']),
-            models.Index(fields=['status']),
-            models.Index(fields=['corresponding_author', 'status']),
-            models.Index(fields=['journal', 'status']),
+            models.Index(fields=['corresponding_author', 'status', '-created_at'], name='art_author_status_created_idx'),
+            models.Index(fields=['journal', 'status', '-created_at'], name='art_journal_status_created_idx'),
+            # Author list without a status filter; admin/reviewer lists sorted by last update
+            models.Index(fields=['corresponding_author', '-created_at'], name='art_author_created_idx'),
+            models.Index(fields=['journal', 'status', '-updated_at'], name='art_journal_status_updated_idx'),
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', 'payment_status']),
+            # Partial index: only rows awaiting or completed payment (publish/production queue)
+            models.Index(
+                fields=['payment_status', 'status'],
+                name='art_paid_ready_idx',
+                condition=models.Q(payment_status__in=['PENDING', 'PAID']),
+            ),
         ]
     
     def __str__(self):
@@ -117,32 +191,52 @@ class Article(models.Model):
     
     def save(self, *args, **kwargs):
         """Override save to enforce workflow rules."""
-        # Generate submission_id if not set
-        if not self.submission_id:
-            self.submission_id = generate_submission_id()
-            # Ensure uniqueness
-            while Article.objects.filter(submission_id=self.submission_id).exists():
-                self.submission_id = generate_submission_id()
-        
         # Set submitted_at when transitioning to SUBMITTED
         if self.status == ArticleStatus.SUBMITTED.value and not self.submitted_at:
             self.submitted_at = timezone.now()
         
-        super().save(*args, **kwargs)
+        if self.submission_id:
+            super().save(*args, **kwargs)
+            return
+        
+        # Generate submission_id; the unique index guards against the
+        # (astronomically rare) collision, in which case we retry. Any other
+        # integrity error (FK, NOT NULL, ...) is raised straight away.
+        for attempt in range(SUBMISSION_ID_MAX_ATTEMPTS):
+            self.submission_id = generate_submission_id()
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                collided = Article.objects.filter(submission_id=self.submission_id).exists()
+                if not collided or attempt == SUBMISSION_ID_MAX_ATTEMPTS - 1:
+                    self.submission_id = ''
+                    raise
     
-    def transition_status(self, new_status: ArticleStatus, user_role: str, user=None):
+    def transition_status(
+        self,
+        new_status: ArticleStatus,
+        user_role: str,
+        user=None,
+        update_fields=()
+    ):
         """
         Transition article to new status with validation.
         
+        Only the workflow columns are written; pass any other fields changed
+        alongside the transition in ``update_fields``.
+        
         Args:
             new_status: Target ArticleStatus
             user_role: User role (AUTHOR, REVIEWER, ADMIN)
             user: User object for audit logging
+            update_fields: Extra fields to persist with the status change
         
         Raises:
             ValidationError: If transition is not allowed
         """
-        current_status = ArticleStatus(self.status)
+        current_status = STATUS_BY_VALUE[self.status]
         from_status_value = current_status.value
         
         # Handle auto-transitions before validation
@@ -181,13 +275,29 @@ class Article(models.Model):
                     "Certificate can only be issued after publication."
                 )
         
-        # Update status
+        # Update status with a conditional UPDATE: it only matches while the
+        # row still holds the status validated above, so a concurrent
+        # transition makes it affect zero rows instead of being overwritten.
+        # update() sends no post_save; the workflow columns written here do
+        # not feed the search vector, so there is nothing to refresh.
         self.status = final_status.value
-        self.save()
+        if self.status == ArticleStatus.SUBMITTED.value and not self.submitted_at:
+            self.submitted_at = timezone.now()
+        self.updated_at = timezone.now()
+        fields = [*TRANSITION_UPDATE_FIELDS, *update_fields]
+        updated = Article.objects.filter(pk=self.pk, status=from_status_value).update(
+            **{name: getattr(self, name) for name in fields}
+        )
+        if not updated:
+            self.status = from_status_value
+            raise ValidationError(
+                f"Article status changed concurrently (expected {from_status_value}); "
+                "reload the article and try again."
+            )
         
         # Log the transition
         from apps.audit.models import AuditLog
-        AuditLog.objects.create(
+        AuditLog.buffer(
             actor=user,
             action='STATUS_CHANGE',
             entity_type='ARTICLE',
@@ -200,6 +310,59 @@ class Article(models.Model):
             }
         )
     
+    def set_authors(self, authors):
+        """
+        Replace the author list with ``authors`` (dicts of ArticleAuthor fields).
+        
+        List order becomes ``ordinal``; rows are written with one bulk INSERT.
+        """
+        self.article_authors.all().delete()
+        ArticleAuthor.objects.bulk_create([
+            ArticleAuthor(article=self, ordinal=ordinal, **author)
+            for ordinal, author in enumerate(authors)
+        ])
+        # The byline names feed the search vector; bulk_create sends no signals
+        self.refresh_search_vector()
+    
+    def refresh_search_vector(self, using=None):
+        """
+        Rebuild ``search_vector`` with a single UPDATE (PostgreSQL only).
+        
+        Indexes the submission id, title, keywords, the corresponding
+        author's email and the byline author names; the email and names are
+        pulled in via subqueries.
+        """
+        using = using or self._state.db or router.db_for_write(Article, instance=self)
+        if connections[using].vendor != 'postgresql':
+            return
+        
+        from apps.accounts.models import User
+        author_email = User.objects.filter(pk=OuterRef('corresponding_author_id')).order_by().values('email')[:1]
+        author_names = (
+            ArticleAuthor.objects.filter(article=OuterRef('pk')).order_by()
+            .values('article').annotate(names=StringAgg('name', ' ')).values('names')
+        )
+        Article.objects.using(using).filter(pk=self.pk).update(
+            search_vector=SearchVector(
+                'submission_id', 'title', 'keywords', Subquery(author_email), Subquery(author_names)
+            )
+        )
+    
+    def next_version_number(self) -> int:
+        """
+        Reserve the next manuscript version number.
+        
+        Increments ``latest_version_number`` with a single UPDATE instead of
+        aggregating MAX(version_number); the UPDATE row-locks the article
+        until the surrounding transaction ends, so concurrent revisions
+        cannot be issued the same number.
+        """
+        Article.objects.filter(pk=self.pk).update(
+            latest_version_number=models.F('latest_version_number') + 1
+        )
+        self.refresh_from_db(fields=['latest_version_number'])
+        return self.latest_version_number
+    
     def get_payment_status(self) -> str:
         """Get current payment status."""
         # Return the payment_status field value
@@ -211,12 +374,39 @@ class Article(models.Model):
             return False
         
         payment_status = self.get_payment_status()
-        return can_publish(ArticleStatus(self.status), payment_status)
+        return can_publish(STATUS_BY_VALUE[self.status], payment_status)
     
     @property
     def current_status_enum(self):
         """Get current status as ArticleStatus enum."""
-        return ArticleStatus(self.status)
+        return STATUS_BY_VALUE[self.status]
+
+
+class ArticleAuthor(models.Model):
+    """
+    Author of an article, in byline order.
+    """
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name='article_authors'
+    )
+    ordinal = models.PositiveSmallIntegerField(help_text='Position in the author list')
+    name = models.CharField(max_length=255)
+    affiliation = models.CharField(max_length=500, blank=True)
+    email = models.EmailField(blank=True)
+    orcid = models.CharField(max_length=19, blank=True, help_text='ORCID iD (0000-0000-0000-0000)')
+    
+    class Meta:
+        db_table = 'article_authors'
+        ordering = ['ordinal']
+        unique_together = ['article', 'ordinal']
+        indexes = [
+            models.Index(fields=['email']),
+        ]
+    
+    def __str__(self):
+        return f"{self.article_id}#{self.ordinal}: {self.name}"
 
 
 class ArticleVersion(models.Model):
@@ -235,11 +425,7 @@ class ArticleVersion(models.Model):
     )
     revision_type = models.CharField(
         max_length=20,
-        choices=[
-            ('INITIAL', 'Initial Submission'),
-            ('MINOR', 'Minor Revision'),
-            ('MAJOR', 'Major Revision'),
-        ],
+        choices=REVISION_TYPE_CHOICES,
         default='INITIAL'
     )
     notes = models.TextField(blank=True, help_text='Author notes for this revision')
@@ -277,13 +463,9 @@ class Review(models.Model):
     )
     
     # Review Content
-    recommendation = models.CharField(
-        max_length=20,
-        choices=[
-            ('ACCEPT', 'Accept'),
-            ('REVISE', 'Revise'),
-            ('REJECT', 'Reject'),
-        ]
+    recommendation = CodedChoiceField(
+        codes=RECOMMENDATION_CODES,
+        choices=RECOMMENDATION_CHOICES
     )
     comments_to_author = models.TextField(
         help_text='Comments visible to the author'
@@ -1,18 +1,37 @@
 """
 Serializers for articles.
 """
+from operator import attrgetter
+
 from rest_framework import serializers
-from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
-from .models import Article, ArticleVersion, Review
-from .workflow import ArticleStatus, get_allowed_transitions
+from .models import STATUS_CHOICES, Article, ArticleAuthor, ArticleVersion, Review
+from .workflow import ALLOWED_TRANSITION_VALUES, ArticleStatus
+from apps.journals.models import Journal
 from apps.journals.serializers import JournalListSerializer
-from apps.accounts.serializers import UserSerializer
+from apps.accounts.serializers import UserListSerializer
+
+
+class ArticleAuthorSerializer(serializers.ModelSerializer):
+    """Serializer for ArticleAuthor (list position is the byline order)."""
+    
+    class Meta:
+        model = ArticleAuthor
+        fields = ['name', 'affiliation', 'email', 'orcid']
 
 
 class ArticleVersionSerializer(serializers.ModelSerializer):
     """Serializer for ArticleVersion."""
+    # Columns read when serializing (for prefetches); article_id lets Django
+    # attach prefetched rows to their article
+    ONLY = (
+        'id', 'article_id', 'version_number', 'manuscript_file', 'revision_type',
+        'notes', 'created_at', 'created_by__email',
+    )
+    
     created_by_email = serializers.EmailField(source='created_by.email', read_only=True)
     
     class Meta:
@@ -26,6 +45,13 @@ class ArticleVersionSerializer(serializers.ModelSerializer):
 
 class ReviewSerializer(serializers.ModelSerializer):
     """Serializer for Review."""
+    # Columns read when serializing (for prefetches)
+    ONLY = (
+        'id', 'article_id', 'recommendation', 'comments_to_author',
+        'confidential_comments', 'created_at', 'updated_at',
+        'reviewer__email', 'reviewer__first_name', 'reviewer__last_name',
+    )
+    
     reviewer_email = serializers.EmailField(source='reviewer.email', read_only=True)
     reviewer_name = serializers.SerializerMethodField()
     
@@ -46,23 +72,75 @@ class ReviewSerializer(serializers.ModelSerializer):
         return None
 
 
-class ArticleListSerializer(serializers.ModelSerializer):
-    """Simplified serializer for article lists."""
-    journal = JournalListSerializer(read_only=True)
-    corresponding_author_email = serializers.EmailField(source='corresponding_author.email', read_only=True)
+class JournalRowSerializer(serializers.Serializer):
+    """Read-only journal representation built from ``values()`` rows."""
+    FIELDS = ('id', 'name', 'issn', 'scope', 'apc_enabled', 'apc_amount',
+              'currency', 'logo', 'is_active')
     
-    class Meta:
-        model = Article
-        fields = [
-            'id', 'submission_id', 'title', 'journal', 'corresponding_author_email',
-            'status', 'created_at', 'updated_at', 'submitted_at'
-        ]
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    issn = serializers.CharField(read_only=True)
+    scope = serializers.CharField(read_only=True)
+    apc_enabled = serializers.BooleanField(read_only=True)
+    apc_amount = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    currency = serializers.CharField(read_only=True)
+    logo = serializers.SerializerMethodField()
+    is_active = serializers.BooleanField(read_only=True)
+    
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_logo(self, row):
+        """Logo URL (absolute when a request is available), like ImageField renders it."""
+        name = getattr(row['logo'], 'name', row['logo'])
+        if not name:
+            return None
+        url = Journal._meta.get_field('logo').storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class ArticleListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for article lists.
+    
+    Consumes rows from ``queryset.values(*ArticleListSerializer.VALUES)``
+    so list pages skip model instantiation and ModelSerializer field
+    resolution; the output matches the nested detail representation.
+    Article instances (e.g. when nested in another serializer) are read
+    through the same paths; select_related the journal and author.
+    """
+    VALUES = (
+        'id', 'submission_id', 'title', 'corresponding_author__email',
+        'status', 'created_at', 'updated_at', 'submitted_at',
+    ) + tuple(f'journal__{name}' for name in JournalRowSerializer.FIELDS)
+    
+    id = serializers.IntegerField(read_only=True)
+    submission_id = serializers.CharField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    journal = JournalRowSerializer(read_only=True)
+    corresponding_author_email = serializers.EmailField(
+        source='corresponding_author__email', read_only=True
+    )
+    status = serializers.ChoiceField(choices=STATUS_CHOICES, read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    submitted_at = serializers.DateTimeField(read_only=True)
+    
+    _GETTERS = tuple((name, attrgetter(name.replace('__', '.'))) for name in VALUES)
+    
+    def to_representation(self, row):
+        if not isinstance(row, dict):
+            row = {name: getter(row) for name, getter in self._GETTERS}
+        row = dict(row, journal={
+            name: row[f'journal__{name}'] for name in JournalRowSerializer.FIELDS
+        })
+        return super().to_representation(row)
 
 
 class ArticleDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for article with nested data."""
     journal = JournalListSerializer(read_only=True)
-    corresponding_author = UserSerializer(read_only=True)
+    corresponding_author = UserListSerializer(read_only=True)
+    authors = ArticleAuthorSerializer(source='article_authors', many=True, read_only=True)
     versions = ArticleVersionSerializer(many=True, read_only=True)
     reviews = ReviewSerializer(many=True, read_only=True)
     allowed_transitions = serializers.SerializerMethodField()
@@ -91,9 +169,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if request and request.user:
             user_role = request.user.role
-            current_status = ArticleStatus(obj.status)
-            transitions = get_allowed_transitions(current_status, user_role)
-            return [status.value for status in transitions]
+            return list(ALLOWED_TRANSITION_VALUES.get((obj.status, user_role), ()))
         return []
     
     @extend_schema_field(OpenApiTypes.STR)
@@ -111,15 +187,19 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     
     @extend_schema_field(OpenApiTypes.BOOL)
     def get_has_certificate(self, obj) -> bool:
-        """Check if article has a certificate."""
+        """Check if article has a certificate (annotated by ArticleViewSet)."""
+        flag = getattr(obj, 'has_certificate_flag', None)
+        if flag is not None:
+            return flag
         try:
             return obj.certificate is not None
-        except Exception:
+        except ObjectDoesNotExist:
             return False
 
 
 class ArticleCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating articles."""
+    authors = ArticleAuthorSerializer(source='article_authors', many=True, required=False)
     
     class Meta:
         model = Article
@@ -132,11 +212,16 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
         """Create article with DRAFT status."""
         validated_data['corresponding_author'] = self.context['request'].user
         validated_data['status'] = ArticleStatus.DRAFT.value
-        return super().create(validated_data)
+        authors = validated_data.pop('article_authors', [])
+        with transaction.atomic():
+            article = super().create(validated_data)
+            article.set_authors(authors)
+        return article
 
 
 class ArticleUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating article metadata (DRAFT only)."""
+    authors = ArticleAuthorSerializer(source='article_authors', many=True, required=False)
     
     class Meta:
         model = Article
@@ -151,6 +236,15 @@ class ArticleUpdateSerializer(serializers.ModelSerializer):
         if instance.status != ArticleStatus.DRAFT.value:
             raise ValidationError("Article can only be edited in DRAFT status.")
         return attrs
+    
+    def update(self, instance, validated_data):
+        """Update metadata; a submitted author list replaces the existing one."""
+        authors = validated_data.pop('article_authors', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if authors is not None:
+                instance.set_authors(authors)
+        return instance
 
 
 class ArticleWorkflowActionSerializer(serializers.Serializer):
@@ -184,3 +278,17 @@ class ArticleWorkflowActionSerializer(serializers.Serializer):
         help_text='Comments for revision request or rejection'
     )
 
+
+class ArticleBulkDeskRejectSerializer(serializers.Serializer):
+    """Serializer for desk rejecting several articles in one request."""
+    article_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+        help_text='IDs of the articles to desk reject'
+    )
+    comments = serializers.CharField(
+        required=False,
+        help_text='Comments sent to every author'
+    )
+
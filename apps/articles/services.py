@@ -2,25 +2,97 @@
 Service layer for article workflow actions.
 All state transitions must go through this service layer for validation.
 """
+from functools import partial
+
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db import models
+from django.db import IntegrityError, transaction
 from .models import Article, ArticleVersion, Review
-from .workflow import ArticleStatus
+from .workflow import STATUS_BY_VALUE, ArticleStatus, can_transition
 from apps.audit.models import AuditLog
 from apps.payments.models import Invoice
+from apps.certificates.tasks import auto_generate_certificate
+from apps.notifications.tasks import (
+    send_article_accepted_email,
+    send_article_published_email,
+    send_article_rejected_email,
+    send_article_submitted_email,
+    send_revision_requested_email,
+)
+
+
+# Notification tasks per Celery message when notifying in bulk.
+NOTIFICATION_CHUNK_SIZE = 50
+
+# Status guards, compared directly against the stored status value.
+_DESK_REJECTABLE = frozenset({ArticleStatus.SUBMITTED.value, ArticleStatus.DESK_CHECK.value})
+_REVIEW_OR_REVISED = frozenset({ArticleStatus.UNDER_REVIEW.value, ArticleStatus.REVISED_SUBMITTED.value})
+_ACCEPTED_OR_PRODUCTION = frozenset({ArticleStatus.ACCEPTED.value, ArticleStatus.PRODUCTION.value})
+_PAYMENT_CLEARED = frozenset({'PAID', 'NOT_REQUIRED'})
+
+
+def _has_versions(article: Article) -> bool:
+    """Use the ``has_versions`` annotation when the article was loaded with one."""
+    flag = getattr(article, 'has_versions', None)
+    if flag is None:
+        flag = article.versions.exists()
+    return flag
+
+
+def _check_payment_gate(article: Article, outcome: str) -> None:
+    """
+    Payment gate shared by production and publication.
+    
+    Reads the denormalized ``payment_status`` column already loaded on the
+    article (kept in step with the invoice by Invoice.mark_as_paid), so no
+    invoice query is needed.
+    """
+    payment_status = article.get_payment_status()
+    if payment_status not in _PAYMENT_CLEARED:
+        raise ValidationError(
+            f"Article cannot {outcome}. Payment status must be PAID or NOT_REQUIRED, "
+            f"but is currently {payment_status}."
+        )
+
+
+def _record_review(
+    article: Article,
+    user,
+    recommendation: str,
+    comments_to_author: str,
+    confidential_comments: str = ''
+) -> Review:
+    """
+    Insert the review row recording a workflow decision.
+    
+    A user has at most one review per article; a second decision by the same
+    user raises ValidationError. The INSERT runs in a savepoint so the
+    conflict does not abort the caller's transaction.
+    """
+    try:
+        with transaction.atomic():
+            return Review.objects.bulk_create([Review(
+                article=article,
+                reviewer=user,
+                recommendation=recommendation,
+                comments_to_author=comments_to_author,
+                confidential_comments=confidential_comments
+            )])[0]
+    except IntegrityError:
+        raise ValidationError("You have already recorded a review for this article.")
 
 
 class ArticleWorkflowService:
     """Service for handling article workflow transitions."""
     
     @staticmethod
+    @transaction.atomic
     def submit_article(article: Article, user) -> Article:
         """Submit article (DRAFT -> SUBMITTED)."""
         if article.status != ArticleStatus.DRAFT.value:
             raise ValidationError("Article must be in DRAFT status to submit.")
         
-        if article.corresponding_author != user:
+        if article.corresponding_author_id != user.pk:
             raise ValidationError("Only the corresponding author can submit the article.")
         
         # Check required fields
@@ -31,13 +103,13 @@ class ArticleWorkflowService:
             raise ValidationError("Ethics and originality declarations are required.")
         
         # Check if article has at least one version
-        if not article.versions.exists():
+        if not _has_versions(article):
             raise ValidationError("Article must have at least one manuscript file.")
         
         article.transition_status(ArticleStatus.SUBMITTED, user.role, user)
         
         # Log submission
-        AuditLog.objects.create(
+        AuditLog.buffer(
             actor=user,
             action='ARTICLE_SUBMITTED',
             entity_type='ARTICLE',
@@ -46,42 +118,31 @@ class ArticleWorkflowService:
         )
         
         # Send email notification
-        from apps.notifications.tasks import send_article_submitted_email
-        send_article_submitted_email.delay(article.id)
+        transaction.on_commit(partial(send_article_submitted_email.delay, article.id))
         
         return article
     
     @staticmethod
+    @transaction.atomic
     def desk_reject(article: Article, user, comments: str = '') -> Article:
         """Desk reject article."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status not in [ArticleStatus.DESK_CHECK, ArticleStatus.SUBMITTED]:
+        if article.status not in _DESK_REJECTABLE:
             raise ValidationError("Article must be in DESK_CHECK or SUBMITTED status.")
         
         article.transition_status(ArticleStatus.REJECTED, user.role, user)
         
         # Create review record
-        review = Review.objects.create(
-            article=article,
-            reviewer=user,
-            recommendation='REJECT',
-            comments_to_author=comments or 'Desk rejected',
-            confidential_comments=''
-        )
+        review = _record_review(article, user, 'REJECT', comments or 'Desk rejected')
         
         # Send email notification
-        from apps.notifications.tasks import send_article_rejected_email
-        send_article_rejected_email.delay(article.id, review.comments_to_author)
+        transaction.on_commit(partial(send_article_rejected_email.delay, article.id, review.comments_to_author))
         
         return article
     
     @staticmethod
     def send_to_review(article: Article, user) -> Article:
         """Send article to review (DESK_CHECK -> UNDER_REVIEW)."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status != ArticleStatus.DESK_CHECK:
+        if article.status != ArticleStatus.DESK_CHECK.value:
             raise ValidationError("Article must be in DESK_CHECK status.")
         
         article.transition_status(ArticleStatus.UNDER_REVIEW, user.role, user)
@@ -89,6 +150,7 @@ class ArticleWorkflowService:
         return article
     
     @staticmethod
+    @transaction.atomic
     def request_revision(
         article: Article,
         user,
@@ -96,9 +158,7 @@ class ArticleWorkflowService:
         comments: str
     ) -> Article:
         """Request revision (UNDER_REVIEW -> REVISION_REQUIRED)."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status != ArticleStatus.UNDER_REVIEW:
+        if article.status != ArticleStatus.UNDER_REVIEW.value:
             raise ValidationError("Article must be in UNDER_REVIEW status.")
         
         if revision_type not in ['MINOR', 'MAJOR']:
@@ -107,17 +167,10 @@ class ArticleWorkflowService:
         article.transition_status(ArticleStatus.REVISION_REQUIRED, user.role, user)
         
         # Create review record
-        review = Review.objects.create(
-            article=article,
-            reviewer=user,
-            recommendation='REVISE',
-            comments_to_author=comments,
-            confidential_comments=f'Revision type: {revision_type}'
-        )
+        review = _record_review(article, user, 'REVISE', comments, f'Revision type: {revision_type}')
         
         # Send email notification
-        from apps.notifications.tasks import send_revision_requested_email
-        send_revision_requested_email.delay(article.id, review.comments_to_author)
+        transaction.on_commit(partial(send_revision_requested_email.delay, article.id, review.comments_to_author))
         
         return article
     
@@ -132,26 +185,29 @@ class ArticleWorkflowService:
         if article.status != ArticleStatus.DRAFT.value:
             raise ValidationError("Article must be in DRAFT status to upload initial manuscript.")
         
-        if article.corresponding_author != user:
+        if article.corresponding_author_id != user.pk:
             raise ValidationError("Only the corresponding author can upload the manuscript.")
         
         # Check if initial version already exists
-        if article.versions.exists():
+        if _has_versions(article):
             raise ValidationError("Initial manuscript already uploaded. Use upload_revision for updates.")
         
         # Create version 1 (initial submission)
-        version = ArticleVersion.objects.create(
-            article=article,
-            version_number=1,
-            manuscript_file=manuscript_file,
-            revision_type='INITIAL',
-            notes=notes,
-            created_by=user
-        )
+        with transaction.atomic():
+            version = ArticleVersion.objects.create(
+                article=article,
+                version_number=article.next_version_number(),
+                manuscript_file=manuscript_file,
+                revision_type='INITIAL',
+                notes=notes,
+                created_by=user
+            )
+        article.has_versions = True
         
         return version
     
     @staticmethod
+    @transaction.atomic
     def submit_revision(
         article: Article,
         user,
@@ -159,22 +215,15 @@ class ArticleWorkflowService:
         notes: str = ''
     ) -> ArticleVersion:
         """Submit revised version."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status != ArticleStatus.REVISION_REQUIRED:
+        if article.status != ArticleStatus.REVISION_REQUIRED.value:
             raise ValidationError("Article must be in REVISION_REQUIRED status.")
         
-        if article.corresponding_author != user:
+        if article.corresponding_author_id != user.pk:
             raise ValidationError("Only the corresponding author can submit revisions.")
         
-        # Get next version number
-        max_version = article.versions.aggregate(
-            max_version=models.Max('version_number')
-        )['max_version'] or 0
-        
         version = ArticleVersion.objects.create(
             article=article,
-            version_number=max_version + 1,
+            version_number=article.next_version_number(),
             manuscript_file=manuscript_file,
             revision_type='MINOR',  # Could be determined from review
             notes=notes,
@@ -188,120 +237,271 @@ class ArticleWorkflowService:
         return version
     
     @staticmethod
+    @transaction.atomic
     def accept_article(article: Article, user, comments: str = '') -> Article:
         """Accept article (UNDER_REVIEW -> ACCEPTED)."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status not in [ArticleStatus.UNDER_REVIEW, ArticleStatus.REVISED_SUBMITTED]:
+        if article.status not in _REVIEW_OR_REVISED:
             raise ValidationError("Article must be in UNDER_REVIEW or REVISED_SUBMITTED status.")
         
-        article.transition_status(ArticleStatus.ACCEPTED, user.role, user)
+        # Payment status is written in the same UPDATE as the transition
+        journal = article.journal
+        requires_apc = journal.apc_enabled and journal.apc_amount > 0
+        previous_payment_status = article.payment_status
+        article.payment_status = 'PENDING' if requires_apc else 'NOT_REQUIRED'
+        try:
+            article.transition_status(
+                ArticleStatus.ACCEPTED, user.role, user,
+                update_fields=['payment_status']
+            )
+        except ValidationError:
+            article.payment_status = previous_payment_status
+            raise
         
         # Create review record
-        review = Review.objects.create(
-            article=article,
-            reviewer=user,
-            recommendation='ACCEPT',
-            comments_to_author=comments or 'Article accepted',
-            confidential_comments=''
-        )
-        
-        # Set payment_status and create invoice if journal requires APC
-        if article.journal.apc_enabled and article.journal.apc_amount > 0:
-            # Create invoice
-            Invoice.objects.get_or_create(
-                article=article,
-                defaults={
-                    'amount': article.journal.apc_amount,
-                    'currency': article.journal.currency,
-                    'status': Invoice.Status.PENDING
-                }
+        _record_review(article, user, 'ACCEPT', comments or 'Article accepted')
+        
+        # Create invoice if journal requires APC; a single
+        # INSERT ... ON CONFLICT DO NOTHING keeps an existing invoice.
+        if requires_apc:
+            Invoice.objects.bulk_create(
+                [Invoice(
+                    invoice_number=Invoice.generate_invoice_number(),
+                    article=article,
+                    amount=journal.apc_amount,
+                    currency=journal.currency,
+                    status=Invoice.Status.PENDING
+                )],
+                ignore_conflicts=True
             )
-            # Set payment_status to PENDING
-            article.payment_status = 'PENDING'
-        else:
-            # No APC required
-            article.payment_status = 'NOT_REQUIRED'
-        
-        article.save()
         
         # Send email notification
-        from apps.notifications.tasks import send_article_accepted_email
-        send_article_accepted_email.delay(article.id)
+        transaction.on_commit(partial(send_article_accepted_email.delay, article.id))
         
         return article
     
     @staticmethod
+    def accept_many(article_ids, user, comments: str = '') -> list:
+        """
+        Accept many articles (UNDER_REVIEW/REVISED_SUBMITTED -> ACCEPTED) at once.
+        
+        Set-based counterpart of accept_article for bulk admin actions: the
+        selected rows are locked and updated with at most two UPDATEs (one per
+        resulting payment_status), and reviews, invoices and audit rows are
+        each written with a single bulk INSERT. Articles not in an acceptable
+        status, or that already have a review by ``user`` (which
+        accept_article rejects), are skipped. Returns the ids of the accepted
+        articles.
+        
+        Per-instance post_save receivers are not sent; none react to ACCEPTED.
+        """
+        from_statuses = [
+            status.value
+            for status in (ArticleStatus.UNDER_REVIEW, ArticleStatus.REVISED_SUBMITTED)
+            if can_transition(status, ArticleStatus.ACCEPTED, user.role)
+        ]
+        if not from_statuses:
+            raise ValidationError(f"Role {user.role} cannot accept articles.")
+        
+        accepted = ArticleStatus.ACCEPTED.value
+        with transaction.atomic():
+            rows = list(
+                Article.objects.filter(pk__in=article_ids, status__in=from_statuses)
+                .exclude(reviews__reviewer=user)
+                .select_for_update(of=('self',))
+                .order_by('pk')
+                .values(
+                    'pk', 'submission_id', 'status',
+                    'journal__apc_enabled', 'journal__apc_amount', 'journal__currency'
+                )
+            )
+            if not rows:
+                return []
+            
+            ids = [row['pk'] for row in rows]
+            apc_rows = [
+                row for row in rows
+                if row['journal__apc_enabled'] and row['journal__apc_amount'] > 0
+            ]
+            apc_ids = {row['pk'] for row in apc_rows}
+            now = timezone.now()
+            Article.objects.filter(pk__in=apc_ids).update(
+                status=accepted, payment_status='PENDING', updated_at=now
+            )
+            Article.objects.filter(pk__in=[pk for pk in ids if pk not in apc_ids]).update(
+                status=accepted, payment_status='NOT_REQUIRED', updated_at=now
+            )
+            
+            # Record the decision
+            Review.objects.bulk_create(
+                [
+                    Review(
+                        article_id=pk,
+                        reviewer=user,
+                        recommendation='ACCEPT',
+                        comments_to_author=comments or 'Article accepted',
+                        confidential_comments=''
+                    )
+                    for pk in ids
+                ]
+            )
+            Invoice.objects.bulk_create(
+                [
+                    Invoice(
+                        invoice_number=Invoice.generate_invoice_number(),
+                        article_id=row['pk'],
+                        amount=row['journal__apc_amount'],
+                        currency=row['journal__currency'],
+                        status=Invoice.Status.PENDING
+                    )
+                    for row in apc_rows
+                ],
+                ignore_conflicts=True
+            )
+            for row in rows:
+                AuditLog.buffer(
+                    actor=user,
+                    action='STATUS_CHANGE',
+                    entity_type='ARTICLE',
+                    entity_id=row['pk'],
+                    metadata={
+                        'from_status': row['status'],
+                        'to_status': accepted,
+                        'submission_id': row['submission_id'],
+                        'requested_status': None
+                    }
+                )
+            
+            # Send email notifications in chunked task batches once committed
+            transaction.on_commit(
+                lambda: send_article_accepted_email.chunks(
+                    [(pk,) for pk in ids], NOTIFICATION_CHUNK_SIZE
+                ).apply_async()
+            )
+        
+        return ids
+    
+    @staticmethod
+    def desk_reject_many(article_ids, user, comments: str = '') -> list:
+        """
+        Desk reject many articles (DESK_CHECK/SUBMITTED -> REJECTED) at once.
+        
+        Set-based counterpart of desk_reject, like accept_many: one locking
+        SELECT, one UPDATE, and single bulk INSERTs for the reviews and audit
+        rows. Rejection emails are queued in chunked batches after commit.
+        Articles not in a desk-rejectable status, or that already have a
+        review by ``user`` (which desk_reject rejects), are skipped. Returns
+        the ids of the rejected articles.
+        """
+        from_statuses = [
+            value for value in _DESK_REJECTABLE
+            if can_transition(STATUS_BY_VALUE[value], ArticleStatus.REJECTED, user.role)
+        ]
+        if not from_statuses:
+            raise ValidationError(f"Role {user.role} cannot desk reject articles.")
+        
+        rejected = ArticleStatus.REJECTED.value
+        comments = comments or 'Desk rejected'
+        with transaction.atomic():
+            rows = list(
+                Article.objects.filter(pk__in=article_ids, status__in=from_statuses)
+                .exclude(reviews__reviewer=user)
+                .select_for_update()
+                .order_by('pk')
+                .values('pk', 'submission_id', 'status')
+            )
+            if not rows:
+                return []
+            
+            ids = [row['pk'] for row in rows]
+            Article.objects.filter(pk__in=ids).update(status=rejected, updated_at=timezone.now())
+            
+            # Record the decision
+            Review.objects.bulk_create(
+                [
+                    Review(
+                        article_id=pk,
+                        reviewer=user,
+                        recommendation='REJECT',
+                        comments_to_author=comments,
+                        confidential_comments=''
+                    )
+                    for pk in ids
+                ]
+            )
+            for row in rows:
+                AuditLog.buffer(
+                    actor=user,
+                    action='STATUS_CHANGE',
+                    entity_type='ARTICLE',
+                    entity_id=row['pk'],
+                    metadata={
+                        'from_status': row['status'],
+                        'to_status': rejected,
+                        'submission_id': row['submission_id'],
+                        'requested_status': None
+                    }
+                )
+            
+            # Send email notifications in chunked task batches once committed
+            transaction.on_commit(
+                lambda: send_article_rejected_email.chunks(
+                    [(pk, comments) for pk in ids], NOTIFICATION_CHUNK_SIZE
+                ).apply_async()
+            )
+        
+        return ids
+    
+    @staticmethod
+    @transaction.atomic
     def reject_article(article: Article, user, comments: str = '') -> Article:
         """Reject article (UNDER_REVIEW -> REJECTED)."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status not in [ArticleStatus.UNDER_REVIEW, ArticleStatus.REVISED_SUBMITTED]:
+        if article.status not in _REVIEW_OR_REVISED:
             raise ValidationError("Article must be in UNDER_REVIEW or REVISED_SUBMITTED status.")
         
         article.transition_status(ArticleStatus.REJECTED, user.role, user)
         
         # Create review record
-        review = Review.objects.create(
-            article=article,
-            reviewer=user,
-            recommendation='REJECT',
-            comments_to_author=comments or 'Article rejected',
-            confidential_comments=''
-        )
+        review = _record_review(article, user, 'REJECT', comments or 'Article rejected')
         
         # Send email notification
-        from apps.notifications.tasks import send_article_rejected_email
-        send_article_rejected_email.delay(article.id, review.comments_to_author)
+        transaction.on_commit(partial(send_article_rejected_email.delay, article.id, review.comments_to_author))
         
         return article
     
     @staticmethod
     def move_to_production(article: Article, user) -> Article:
         """Move article to production (ACCEPTED -> PRODUCTION)."""
-        current_status = ArticleStatus(article.status)
-        
-        if current_status != ArticleStatus.ACCEPTED:
+        if article.status != ArticleStatus.ACCEPTED.value:
             raise ValidationError("Article must be in ACCEPTED status.")
         
-        # Payment gate: payment_status must be PAID or NOT_REQUIRED
-        payment_status = article.get_payment_status()
-        if payment_status not in ['PAID', 'NOT_REQUIRED']:
-            raise ValidationError(
-                f"Article cannot move to production. Payment status must be PAID or NOT_REQUIRED, "
-                f"but is currently {payment_status}."
-            )
+        _check_payment_gate(article, 'move to production')
         
         article.transition_status(ArticleStatus.PRODUCTION, user.role, user)
         
         return article
     
     @staticmethod
+    @transaction.atomic
     def publish_article(
         article: Article,
         user,
         publication_url: str
     ) -> Article:
         """Publish article (ACCEPTED/PRODUCTION -> PUBLISHED)."""
-        current_status = ArticleStatus(article.status)
-        
-        # Payment gate: payment_status must be PAID or NOT_REQUIRED
-        payment_status = article.get_payment_status()
-        if payment_status not in ['PAID', 'NOT_REQUIRED']:
-            raise ValidationError(
-                f"Article cannot be published. Payment status must be PAID or NOT_REQUIRED, "
-                f"but is currently {payment_status}."
-            )
+        _check_payment_gate(article, 'be published')
         
-        if current_status not in [ArticleStatus.ACCEPTED, ArticleStatus.PRODUCTION]:
+        if article.status not in _ACCEPTED_OR_PRODUCTION:
             raise ValidationError("Article must be in ACCEPTED or PRODUCTION status.")
         
         article.publication_url = publication_url
         article.publication_date = timezone.now().date()
-        article.transition_status(ArticleStatus.PUBLISHED, user.role, user)
+        article.transition_status(
+            ArticleStatus.PUBLISHED, user.role, user,
+            update_fields=['publication_url', 'publication_date']
+        )
         
         # Log publication
-        AuditLog.objects.create(
+        AuditLog.buffer(
             actor=user,
             action='ARTICLE_PUBLISHED',
             entity_type='ARTICLE',
@@ -312,9 +512,9 @@ class ArticleWorkflowService:
             }
         )
         
-        # Send email notification
-        from apps.notifications.tasks import send_article_published_email
-        send_article_published_email.delay(article.id)
+        # Issue the certificate and notify the author
+        transaction.on_commit(partial(auto_generate_certificate.delay, article.id))
+        transaction.on_commit(partial(send_article_published_email.delay, article.id))
         
         return article
 
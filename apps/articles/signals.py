@@ -4,19 +4,16 @@ Signals for article lifecycle events.
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Article
-from .workflow import ArticleStatus
-from apps.certificates.tasks import auto_generate_certificate
 
 
-@receiver(post_save, sender=Article)
-def handle_article_status_change(sender, instance, created, **kwargs):
-    """
-    Handle article status changes and trigger appropriate actions.
-    """
-    if created:
-        return  # Skip on creation
-    
-    # Auto-generate certificate when article is published
-    if instance.status == ArticleStatus.PUBLISHED.value:
-        auto_generate_certificate.delay(instance.id)
+# Article columns feeding Article.search_vector (the byline author names are
+# refreshed by Article.set_authors)
+SEARCH_VECTOR_SOURCES = frozenset({'submission_id', 'title', 'keywords', 'corresponding_author'})
+
 
+@receiver(post_save, sender=Article)
+def update_search_vector(sender, instance, created, using, update_fields=None, **kwargs):
+    """Refresh the full-text search vector (PostgreSQL only)."""
+    if update_fields is not None and not SEARCH_VECTOR_SOURCES.intersection(update_fields):
+        return
+    instance.refresh_search_vector(using)
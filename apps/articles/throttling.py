@@ -6,32 +6,70 @@ from django.core.cache import cache
 from django.conf import settings
 
 
-class ArticleSubmissionThrottle(UserRateThrottle):
+class CounterThrottleMixin:
+    """
+    Fixed-window counter in place of DRF's per-client request history.
+    
+    DRF's SimpleRateThrottle reads and rewrites a pickled list of request
+    timestamps (up to ``num_requests`` entries) on every request. Here each
+    client gets one integer counter per window, keyed by the window index,
+    and counted with the cache's atomic add()/incr().
+    """
+    
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        
+        self.now = self.timer()
+        self.key = f'{self.key}:{int(self.now) // self.duration}'
+        if self._increment() <= self.num_requests:
+            return True
+        return self.throttle_failure()
+    
+    def _increment(self):
+        if self.cache.add(self.key, 1, self.duration):
+            return 1
+        try:
+            return self.cache.incr(self.key)
+        except ValueError:
+            # The window's counter expired between add() and incr()
+            self.cache.set(self.key, 1, self.duration)
+            return 1
+    
+    def wait(self):
+        """Seconds until the current window closes."""
+        return self.duration - (self.now % self.duration)
+
+
+class ArticleSubmissionThrottle(CounterThrottleMixin, UserRateThrottle):
     """Throttle article submissions."""
     scope = 'article_submission'
     rate = '5/hour'  # 5 submissions per hour per user
 
 
-class ArticleWorkflowThrottle(UserRateThrottle):
+class ArticleWorkflowThrottle(CounterThrottleMixin, UserRateThrottle):
     """Throttle workflow actions."""
     scope = 'workflow_action'
     rate = '20/hour'  # 20 actions per hour per user
 
 
-class PublicAPIRateThrottle(AnonRateThrottle):
+class PublicAPIRateThrottle(CounterThrottleMixin, AnonRateThrottle):
     """Throttle public API endpoints."""
     scope = 'public_api'
     rate = '100/hour'  # 100 requests per hour per IP
 
 
-class WebhookRateThrottle(AnonRateThrottle):
+class WebhookRateThrottle(CounterThrottleMixin, AnonRateThrottle):
     """Throttle webhook endpoints."""
     scope = 'webhook'
     rate = '1000/hour'  # 1000 requests per hour per IP (webhooks can be frequent)
 
 
-class CertificateVerificationThrottle(AnonRateThrottle):
+class CertificateVerificationThrottle(CounterThrottleMixin, AnonRateThrottle):
     """Throttle certificate verification."""
     scope = 'certificate_verification'
     rate = '60/minute'  # 60 verifications per minute per IP
-
@@ -1,24 +1,32 @@
 """
 API views for articles.
 """
+import hashlib
+
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.throttling import UserRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
+from django.http import HttpResponse, StreamingHttpResponse
+from django.db.models import Exists, F, OuterRef, Prefetch, Window
+from django.db.models.functions import RowNumber
 from django.core.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 
 from .models import Article, ArticleVersion, Review
+from .workflow import ALLOWED_TRANSITION_VALUES, ArticleStatus
 from .serializers import (
     ArticleListSerializer,
     ArticleDetailSerializer,
     ArticleCreateSerializer,
     ArticleUpdateSerializer,
     ArticleWorkflowActionSerializer,
+    ArticleBulkDeskRejectSerializer,
     ArticleVersionSerializer,
     ReviewSerializer
 )
@@ -29,11 +37,149 @@ from apps.accounts.permissions import (
     IsReviewer,
     IsAdmin,
     IsAuthorOrAdmin,
-    IsReviewerOrAdmin
+    IsReviewerOrAdmin,
+    MASK_REVIEWER_ADMIN,
+    ROLE_ADMIN,
+    ROLE_AUTHOR,
 )
+from apps.certificates.models import Certificate
 from apps.journals.models import ReviewerJournalAssignment
 
 
+def _error_body(message):
+    """Render ``{'error': message}`` once, at import time."""
+    return JSONRenderer().render({'error': message})
+
+
+def _forbidden(body):
+    """
+    403 response for a pre-rendered error body.
+    
+    Authorization failures skip DRF's Response/renderer round trip. A new
+    HttpResponse is built each time because middleware mutates headers.
+    """
+    return HttpResponse(body, status=status.HTTP_403_FORBIDDEN, content_type='application/json')
+
+
+def _stream_ndjson(serializer_class, queryset, chunk_size=500):
+    """
+    Yield one JSON line per row of ``queryset``.
+    
+    Rows are read with ``iterator()`` (a server-side cursor on PostgreSQL), so
+    only ``chunk_size`` rows are held in memory however long the result is.
+    """
+    renderer = JSONRenderer()
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield renderer.render(serializer_class(row).data) + b'\n'
+
+
+RECENT_AUDIT_LIMIT = 10
+
+
+def _attach_recent_audit(items, limit=RECENT_AUDIT_LIMIT):
+    """
+    Add each listed article's latest ``limit`` audit entries as ``recent_audit``.
+    
+    One query for the whole page: entries are ranked per article with a
+    ROW_NUMBER() window and cut at ``limit`` in the database.
+    """
+    from apps.audit.models import AuditLog
+    from apps.audit.serializers import AuditLogSerializer
+    logs = list(
+        AuditLog.objects.filter(article_id__in=[item['id'] for item in items])
+        .annotate(rank=Window(
+            RowNumber(),
+            partition_by=F('article_id'),
+            order_by=(F('created_at').desc(), F('id').desc()),
+        ))
+        .filter(rank__lte=limit)
+        .select_related('actor')
+        .only('article_id', *AuditLogSerializer.ONLY)
+        .order_by('article_id', 'rank')
+    )
+    by_article = {}
+    for log, entry in zip(logs, AuditLogSerializer(logs, many=True).data):
+        by_article.setdefault(log.article_id, []).append(entry)
+    for item in items:
+        item['recent_audit'] = by_article.get(item['id'], [])
+
+
+_ERR_NOT_AUTHOR_UPLOAD = _error_body('Only the corresponding author can upload manuscripts.')
+_ERR_NOT_AUTHOR_REVISION = _error_body('Only the corresponding author can upload revisions.')
+
+# action -> (allowed role bitmask, service method, (serializer field, default) args,
+# pre-rendered 403 body returned to other roles)
+_ACTION_DISPATCH = {
+    'submit': (
+        ROLE_AUTHOR, 'submit_article', (),
+        _error_body('Only authors can submit articles.'),
+    ),
+    'desk_reject': (
+        ROLE_ADMIN, 'desk_reject', (('comments', ''),),
+        _error_body('Only admins can desk reject articles.'),
+    ),
+    # Only ADMIN can send from DESK_CHECK; service validates status
+    'send_to_review': (
+        ROLE_ADMIN, 'send_to_review', (),
+        _error_body('Only admins can send articles to review from desk check.'),
+    ),
+    'request_revision': (
+        MASK_REVIEWER_ADMIN, 'request_revision',
+        (('revision_type', 'MINOR'), ('comments', '')),
+        _error_body('Only reviewers or admins can request revisions.'),
+    ),
+    'accept': (
+        ROLE_ADMIN, 'accept_article', (('comments', ''),),
+        _error_body('Only admins can accept articles.'),
+    ),
+    'reject': (
+        ROLE_ADMIN, 'reject_article', (('comments', ''),),
+        _error_body('Only admins can reject articles.'),
+    ),
+    'move_to_production': (
+        ROLE_ADMIN, 'move_to_production', (),
+        _error_body('Only admins can move articles to production.'),
+    ),
+    'publish': (
+        ROLE_ADMIN, 'publish_article', (('publication_url', None),),
+        _error_body('Only admins can publish articles.'),
+    ),
+}
+
+
+def _transition_table(role):
+    """Pre-render ``{status: [allowed next statuses]}`` for ``role`` with its ETag."""
+    body = JSONRenderer().render({
+        article_status.value: list(ALLOWED_TRANSITION_VALUES[(article_status.value, role)])
+        for article_status in ArticleStatus
+    })
+    return body, '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+
+
+# role -> (JSON body, ETag) served by ArticleViewSet.transitions
+_TRANSITION_TABLES = {role: _transition_table(role) for role in ('AUTHOR', 'REVIEWER', 'ADMIN')}
+
+
+# Manuscript upload handler by article status: the initial manuscript while
+# DRAFT, a revision (which resumes review) while REVISION_REQUIRED.
+_UPLOAD_HANDLERS = {
+    'DRAFT': ArticleWorkflowService.upload_initial_manuscript,
+    'REVISION_REQUIRED': ArticleWorkflowService.submit_revision,
+}
+
+
+# Actions that load one article only to act on it. They fetch just the columns
+# the workflow service reads instead of the detail queryset's joins/prefetches.
+_ACTION_ARTICLE_FIELDS = (
+    'id', 'submission_id', 'title', 'abstract', 'corresponding_author_id',
+    'status', 'payment_status', 'ethics_declaration', 'originality_declaration',
+    'publication_url', 'publication_date', 'submitted_at', 'updated_at',
+    'latest_version_number',
+    'journal__apc_enabled', 'journal__apc_amount', 'journal__currency',
+)
+_SLIM_ACTIONS = frozenset({'workflow_action', 'upload_manuscript', 'upload_revision', 'timeline'})
+
+
 class ArticleViewSet(viewsets.ModelViewSet):
     """
     ViewSet for articles.
@@ -44,7 +190,18 @@ class ArticleViewSet(viewsets.ModelViewSet):
     """
     queryset = Article.objects.select_related(
         'corresponding_author', 'journal'
-    ).prefetch_related('versions', 'reviews').all()
+    ).prefetch_related(
+        'article_authors',
+        Prefetch('versions', queryset=ArticleVersion.objects.select_related('created_by').only(
+            *ArticleVersionSerializer.ONLY
+        )),
+        Prefetch('reviews', queryset=Review.objects.select_related('reviewer').only(
+            *ReviewSerializer.ONLY
+        )),
+    ).annotate(
+        has_certificate_flag=Exists(Certificate.objects.filter(article=OuterRef('pk'))),
+        has_versions=Exists(ArticleVersion.objects.filter(article=OuterRef('pk'))),
+    )
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'journal']
@@ -60,27 +217,69 @@ class ArticleViewSet(viewsets.ModelViewSet):
             return ArticleCreateSerializer
         elif self.action == 'update' or self.action == 'partial_update':
             return ArticleUpdateSerializer
-        return ArticleDetailSerializer
+        # Extra actions declare their own serializer_class on @action
+        return self.serializer_class or ArticleDetailSerializer
+    
+    def _action_queryset(self):
+        """
+        Base queryset for the current action, before role filtering.
+        
+        Only retrieve (and anything not listed) walks the nested relations of
+        ArticleDetailSerializer, so only it gets the joins, prefetches and
+        annotations of ``queryset``. List selects flat values() rows; update
+        and destroy need the bare row (DRF drops prefetch caches after an
+        update anyway).
+        """
+        if self.action in _SLIM_ACTIONS:
+            return Article.objects.select_related('journal').only(
+                *_ACTION_ARTICLE_FIELDS
+            ).annotate(
+                has_versions=Exists(ArticleVersion.objects.filter(article=OuterRef('pk')))
+            )
+        if self.action in ('list', 'update', 'partial_update', 'destroy'):
+            return Article.objects.all()
+        return self.queryset
     
     def get_queryset(self):
         """Filter queryset based on user role."""
         user = self.request.user
+        queryset = self._action_queryset()
         
         if user.role == 'AUTHOR':
             # Authors see only their own articles
-            return self.queryset.filter(corresponding_author=user)
+            return queryset.filter(corresponding_author_id=user.pk)
         elif user.role == 'REVIEWER':
-            # Reviewers see articles from their assigned journals
-            assigned_journals = ReviewerJournalAssignment.objects.filter(
-                reviewer=user
-            ).values_list('journal_id', flat=True)
-            return self.queryset.filter(journal_id__in=assigned_journals)
+            # Reviewers see articles from their assigned journals; a correlated
+            # EXISTS probes the (reviewer, journal) unique index per row
+            return queryset.filter(Exists(
+                ReviewerJournalAssignment.objects.filter(
+                    reviewer_id=user.pk, journal_id=OuterRef('journal_id')
+                )
+            ))
         elif user.role == 'ADMIN':
             # Admins see all articles
-            return self.queryset
+            return queryset
         
         return Article.objects.none()
     
+    def list(self, request, *args, **kwargs):
+        """
+        List articles from flat ``values()`` rows (one SELECT per page).
+        
+        ``?include=timeline`` adds each article's latest audit entries, fetched
+        for the whole page in one more query.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(*ArticleListSerializer.VALUES)
+        
+        page = self.paginate_queryset(queryset)
+        data = self.get_serializer(queryset if page is None else page, many=True).data
+        if request.query_params.get('include') == 'timeline':
+            _attach_recent_audit(data)
+        
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+    
     def get_permissions(self):
         """Set permissions based on action."""
         if self.action == 'create':
@@ -93,7 +292,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
         """Apply different throttles based on action."""
         if self.action == 'create':
             return [ArticleSubmissionThrottle()]
-        elif self.action == 'workflow_action':
+        elif self.action in ('workflow_action', 'bulk_desk_reject'):
             return [ArticleWorkflowThrottle()]
         return super().get_throttles()
     
@@ -166,111 +365,110 @@ class ArticleViewSet(viewsets.ModelViewSet):
     def workflow_action(self, request, pk=None):
         """Handle workflow actions."""
         article = self.get_object()
-        serializer = ArticleWorkflowActionSerializer(data=request.data)
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        action_type = serializer.validated_data['action']
-        service = ArticleWorkflowService()
+        data = serializer.validated_data
+        role_mask, method_name, arg_fields, forbidden = _ACTION_DISPATCH[data['action']]
+        if not request.user.role_bit & role_mask:
+            return _forbidden(forbidden)
+        if data['action'] == 'publish' and not data.get('publication_url'):
+            return Response(
+                {'error': 'Publication URL is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
+        args = [data.get(field, default) for field, default in arg_fields]
         try:
-            if action_type == 'submit':
-                if request.user.role != 'AUTHOR':
-                    return Response(
-                        {'error': 'Only authors can submit articles.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                service.submit_article(article, request.user)
-                
-            elif action_type == 'desk_reject':
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can desk reject articles.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                comments = serializer.validated_data.get('comments', '')
-                service.desk_reject(article, request.user, comments)
-                
-            elif action_type == 'send_to_review':
-                # Only ADMIN can send from DESK_CHECK; service validates status
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can send articles to review from desk check.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                service.send_to_review(article, request.user)
-                
-            elif action_type == 'request_revision':
-                if request.user.role not in ['REVIEWER', 'ADMIN']:
-                    return Response(
-                        {'error': 'Only reviewers or admins can request revisions.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                revision_type = serializer.validated_data.get('revision_type', 'MINOR')
-                comments = serializer.validated_data.get('comments', '')
-                service.request_revision(article, request.user, revision_type, comments)
-                
-            elif action_type == 'accept':
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can accept articles.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                comments = serializer.validated_data.get('comments', '')
-                service.accept_article(article, request.user, comments)
-                
-            elif action_type == 'reject':
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can reject articles.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                comments = serializer.validated_data.get('comments', '')
-                service.reject_article(article, request.user, comments)
-                
-            elif action_type == 'move_to_production':
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can move articles to production.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                service.move_to_production(article, request.user)
-                
-            elif action_type == 'publish':
-                if request.user.role != 'ADMIN':
-                    return Response(
-                        {'error': 'Only admins can publish articles.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                publication_url = serializer.validated_data.get('publication_url')
-                if not publication_url:
-                    return Response(
-                        {'error': 'Publication URL is required.'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                service.publish_article(article, request.user, publication_url)
+            getattr(ArticleWorkflowService, method_name)(article, request.user, *args)
             
-            article.refresh_from_db()
+            # Re-query through the detail queryset (joins, prefetches and the
+            # certificate annotation); get_object() loaded a slim instance and
+            # visibility has already been checked.
+            article = self.queryset.get(pk=article.pk)
             return Response(
                 ArticleDetailSerializer(article, context={'request': request}).data,
                 status=status.HTTP_200_OK
             )
-            
+        
         except ValidationError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @extend_schema(
+        summary="Allowed workflow transitions",
+        description="""
+        Map of every article status to the statuses the requesting user's role
+        may move it to. The table is static per role: responses carry an ETag
+        and can be cached; a matching If-None-Match returns 304.
+        """,
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, methods=['get'])
+    def transitions(self, request):
+        """Serve the pre-rendered transition table for the user's role."""
+        table = _TRANSITION_TABLES.get(request.user.role)
+        if table is None:
+            return Response({})
+        body, etag = table
+        
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, max-age=86400'
+        return response
+    
+    @extend_schema(
+        summary="Desk reject several articles",
+        description="""
+        Desk reject (DESK_CHECK/SUBMITTED → REJECTED) a batch of articles in one
+        transaction (Admin only). Articles not in a desk-rejectable status are
+        skipped and reported back; rejection emails are queued in batches.
+        """,
+        request=ArticleBulkDeskRejectSerializer,
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+    )
+    @action(detail=False, methods=['post'], permission_classes=[IsAdmin],
+            serializer_class=ArticleBulkDeskRejectSerializer)
+    def bulk_desk_reject(self, request):
+        """Desk reject the given articles set-based."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        article_ids = serializer.validated_data['article_ids']
+        comments = serializer.validated_data.get('comments', '')
+        try:
+            rejected = ArticleWorkflowService.desk_reject_many(article_ids, request.user, comments)
+        except ValidationError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        rejected_ids = set(rejected)
+        return Response(
+            {
+                'rejected': rejected,
+                'skipped': sorted(set(article_ids) - rejected_ids),
+            },
+            status=status.HTTP_200_OK
+        )
+    
     @action(detail=True, methods=['post'])
     def upload_manuscript(self, request, pk=None):
         """Upload initial manuscript file (DRAFT status) or revised manuscript (REVISION_REQUIRED status)."""
         article = self.get_object()
         
-        if article.corresponding_author != request.user:
-            return Response(
-                {'error': 'Only the corresponding author can upload manuscripts.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        if article.corresponding_author_id != request.user.pk:
+            return _forbidden(_ERR_NOT_AUTHOR_UPLOAD)
         
         manuscript_file = request.FILES.get('manuscript_file')
         if not manuscript_file:
@@ -281,21 +479,15 @@ class ArticleViewSet(viewsets.ModelViewSet):
         
         notes = request.data.get('notes', '')
         
+        handler = _UPLOAD_HANDLERS.get(article.status)
+        if handler is None:
+            return Response(
+                {'error': 'Article must be in DRAFT or REVISION_REQUIRED status to upload manuscript.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
-            service = ArticleWorkflowService()
-            
-            # Handle initial upload (DRAFT status)
-            if article.status == 'DRAFT':
-                version = service.upload_initial_manuscript(article, request.user, manuscript_file, notes)
-            # Handle revision upload (REVISION_REQUIRED status)
-            elif article.status == 'REVISION_REQUIRED':
-                version = service.submit_revision(article, request.user, manuscript_file, notes)
-            else:
-                return Response(
-                    {'error': 'Article must be in DRAFT or REVISION_REQUIRED status to upload manuscript.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
+            version = handler(article, request.user, manuscript_file, notes)
             return Response(
                 ArticleVersionSerializer(version).data,
                 status=status.HTTP_201_CREATED
@@ -317,11 +509,8 @@ class ArticleViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        if article.corresponding_author != request.user:
-            return Response(
-                {'error': 'Only the corresponding author can upload revisions.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        if article.corresponding_author_id != request.user.pk:
+            return _forbidden(_ERR_NOT_AUTHOR_REVISION)
         
         manuscript_file = request.FILES.get('manuscript_file')
         if not manuscript_file:
@@ -333,8 +522,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
         notes = request.data.get('notes', '')
         
         try:
-            service = ArticleWorkflowService()
-            version = service.submit_revision(article, request.user, manuscript_file, notes)
+            version = ArticleWorkflowService.submit_revision(article, request.user, manuscript_file, notes)
             return Response(
                 ArticleVersionSerializer(version).data,
                 status=status.HTTP_201_CREATED
@@ -347,17 +535,32 @@ class ArticleViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['get'])
     def timeline(self, request, pk=None):
-        """Get article timeline/audit log."""
+        """
+        Get article timeline/audit log.
+        
+        Cursor-paginated; ``?stream=true`` instead streams the whole trail as
+        newline-delimited JSON for exports.
+        """
         article = self.get_object()
         
         from apps.audit.models import AuditLog
+        from apps.audit.pagination import AuditLogCursorPagination
+        from apps.audit.serializers import AuditLogSerializer
         logs = AuditLog.objects.filter(
-            entity_type='ARTICLE',
-            entity_id=article.id
-        ).order_by('created_at')
+            article_id=article.id
+        ).select_related('actor').only(*AuditLogSerializer.ONLY)
         
-        from apps.audit.serializers import AuditLogSerializer
-        return Response(
-            AuditLogSerializer(logs, many=True).data
+        if request.query_params.get('stream') == 'true':
+            return StreamingHttpResponse(
+                _stream_ndjson(AuditLogSerializer, logs.order_by('created_at', 'id')),
+                content_type='application/x-ndjson'
+            )
+        
+        # No view passed: the viewset's OrderingFilter/ordering apply to
+        # articles, not to the audit trail
+        paginator = AuditLogCursorPagination()
+        page = paginator.paginate_queryset(logs, request)
+        return paginator.get_paginated_response(
+            AuditLogSerializer(page, many=True).data
         )
 
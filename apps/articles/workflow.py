@@ -4,7 +4,7 @@ Article workflow state machine.
 Enforces strict state transitions according to tz.md.
 """
 from enum import Enum
-from typing import Set, Dict, List
+from typing import Set, Dict, FrozenSet, List, Tuple
 
 
 class ArticleStatus(Enum):
@@ -28,6 +28,10 @@ class ArticleStatus(Enum):
     ARCHIVED = 'ARCHIVED'
 
 
+# Status members by value; plain dict lookup instead of ArticleStatus(value).
+STATUS_BY_VALUE: Dict[str, ArticleStatus] = {status.value: status for status in ArticleStatus}
+
+
 # Allowed state transitions
 # Format: {from_state: {to_state: [allowed_roles]}}
 ALLOWED_TRANSITIONS: Dict[ArticleStatus, Dict[ArticleStatus, List[str]]] = {
@@ -80,6 +84,38 @@ ALLOWED_TRANSITIONS: Dict[ArticleStatus, Dict[ArticleStatus, List[str]]] = {
 }
 
 
+# Flat lookup tables derived once from ALLOWED_TRANSITIONS.
+# (from_status, to_status) -> roles allowed to perform the transition
+_TRANSITIONS: Dict[Tuple[ArticleStatus, ArticleStatus], FrozenSet[str]] = {
+    (from_status, to_status): frozenset(roles)
+    for from_status, targets in ALLOWED_TRANSITIONS.items()
+    for to_status, roles in targets.items()
+}
+# from_status -> ((to_status, roles), ...) in declaration order
+_OUTGOING: Dict[ArticleStatus, Tuple[Tuple[ArticleStatus, FrozenSet[str]], ...]] = {
+    from_status: tuple((to_status, frozenset(roles)) for to_status, roles in targets.items())
+    for from_status, targets in ALLOWED_TRANSITIONS.items()
+}
+
+WORKFLOW_ROLES = ('AUTHOR', 'REVIEWER', 'ADMIN', 'SYSTEM')
+
+
+def _next_statuses(current_status: ArticleStatus, user_role: str) -> Tuple[ArticleStatus, ...]:
+    return tuple(
+        next_status
+        for next_status, roles in _OUTGOING.get(current_status, ())
+        if 'SYSTEM' in roles or user_role in roles
+    )
+
+
+# (status, role) -> allowed next statuses, for every status and workflow role
+_ALLOWED_NEXT: Dict[Tuple[ArticleStatus, str], Tuple[ArticleStatus, ...]] = {
+    (status, role): _next_statuses(status, role)
+    for status in ArticleStatus
+    for role in WORKFLOW_ROLES
+}
+
+
 def can_transition(
     from_status: ArticleStatus,
     to_status: ArticleStatus,
@@ -96,21 +132,12 @@ def can_transition(
     Returns:
         True if transition is allowed, False otherwise
     """
-    if from_status not in ALLOWED_TRANSITIONS:
-        return False
-    
-    transitions = ALLOWED_TRANSITIONS[from_status]
-    if to_status not in transitions:
+    allowed_roles = _TRANSITIONS.get((from_status, to_status))
+    if not allowed_roles:
         return False
     
-    allowed_roles = transitions[to_status]
-    
     # SYSTEM transitions are automatic (handled by backend logic)
-    if 'SYSTEM' in allowed_roles:
-        return True
-    
-    # Check user role
-    return user_role in allowed_roles
+    return 'SYSTEM' in allowed_roles or user_role in allowed_roles
 
 
 def get_allowed_transitions(
@@ -127,15 +154,18 @@ def get_allowed_transitions(
     Returns:
         List of allowed next statuses
     """
-    if current_status not in ALLOWED_TRANSITIONS:
-        return []
-    
-    allowed = []
-    for next_status, roles in ALLOWED_TRANSITIONS[current_status].items():
-        if 'SYSTEM' in roles or user_role in roles:
-            allowed.append(next_status)
-    
-    return allowed
+    allowed = _ALLOWED_NEXT.get((current_status, user_role))
+    if allowed is None:
+        allowed = _next_statuses(current_status, user_role)
+    return list(allowed)
+
+
+# Allowed next status values keyed by (status value, role). The transition
+# table is static, so serializers look results up instead of recomputing them.
+ALLOWED_TRANSITION_VALUES: Dict[tuple, tuple] = {
+    (status.value, role): tuple(next_status.value for next_status in allowed)
+    for (status, role), allowed in _ALLOWED_NEXT.items()
+}
 
 
 def is_terminal_state(status: ArticleStatus) -> bool:
@@ -6,7 +6,7 @@ from .models import AuditLog
 class AuditLogAdmin(admin.ModelAdmin):
     list_display = ('actor', 'action', 'entity_type', 'entity_id', 'created_at')
     list_filter = ('action', 'entity_type', 'created_at')
-    search_fields = ('actor__email', 'entity_type', 'metadata')
+    search_fields = ('actor__email', 'entity_type')
     readonly_fields = ('actor', 'action', 'entity_type', 'entity_id', 'metadata', 'created_at')
     
     def has_add_permission(self, request):
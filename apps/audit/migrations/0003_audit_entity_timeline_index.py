@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0002_audit_created_at_event_time'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['entity_type', 'entity_id', 'created_at'], name='audit_logs_entity__3d1d1b_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='audit_logs_entity__d4c2e5_idx',
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_article(apps, schema_editor):
+    AuditLog = apps.get_model('audit', 'AuditLog')
+    Article = apps.get_model('articles', 'Article')
+    # Entries of deleted articles keep article NULL (the FK must resolve)
+    AuditLog.objects.filter(
+        entity_type='ARTICLE',
+        entity_id__in=Article.objects.values('pk'),
+    ).update(article_id=F('entity_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_article_list_order_indexes'),
+        ('audit', '0003_audit_entity_timeline_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='article',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Article the entry belongs to (ARTICLE entries only)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_logs', to='articles.article'),
+        ),
+        migrations.RunPython(backfill_article, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['article', 'created_at'], name='audit_logs_article_c6f5bf_idx'),
+        ),
+    ]
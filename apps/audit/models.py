@@ -1,10 +1,58 @@
 """
 Audit logging models.
 """
-from django.db import models
+import threading
+import weakref
+
+from django.db import models, transaction
+from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 
+AUDIT_BUFFER_BATCH_SIZE = 500
+
+_buffer = threading.local()
+
+
+def _ship(logs):
+    """
+    Hand audit rows to the record_audit_logs task as one message.
+    
+    Rows are written inline if the message cannot be sent (broker down,
+    connection refused, ...), so an outage never loses audit entries and
+    never raises out of the on_commit hook.
+    """
+    from .tasks import record_audit_logs
+    
+    rows = [
+        {
+            'actor_id': log.actor_id,
+            'action': log.action,
+            'entity_type': log.entity_type,
+            'entity_id': log.entity_id,
+            'article_id': log.article_id,
+            'metadata': log.metadata,
+            'created_at': log.created_at.isoformat(),
+        }
+        for log in logs
+    ]
+    try:
+        record_audit_logs.delay(rows)
+    except Exception:
+        AuditLog.objects.bulk_create(logs, batch_size=AUDIT_BUFFER_BATCH_SIZE)
+
+
+class _AuditBatch:
+    """Audit rows buffered at one savepoint level, shipped by its on_commit hook."""
+    
+    def __init__(self):
+        self.logs = []
+    
+    def flush(self):
+        logs, self.logs = self.logs, None
+        if logs:
+            _ship(logs)
+
 
 class AuditLog(models.Model):
     """
@@ -52,6 +100,17 @@ class AuditLog(models.Model):
     entity_id = models.PositiveIntegerField(
         help_text='ID of the entity'
     )
+    # Set alongside entity_id for ARTICLE entries, so an article's timeline
+    # is read through an integer FK index
+    article = models.ForeignKey(
+        'articles.Article',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name='audit_logs',
+        help_text='Article the entry belongs to (ARTICLE entries only)'
+    )
     
     # Metadata
     metadata = models.JSONField(
@@ -59,8 +118,8 @@ class AuditLog(models.Model):
         help_text='Additional action metadata'
     )
     
-    # Timestamp
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Timestamp (set when the action happens, not when the row is written)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         db_table = 'audit_logs'
@@ -68,10 +127,48 @@ class AuditLog(models.Model):
         indexes = [
             models.Index(fields=['actor']),
             models.Index(fields=['action']),
-            models.Index(fields=['entity_type', 'entity_id']),
+            models.Index(fields=['entity_type', 'entity_id', 'created_at']),
+            models.Index(fields=['article', 'created_at']),
             models.Index(fields=['created_at']),
         ]
     
+    @classmethod
+    def buffer(cls, **fields):
+        """
+        Record an audit row without an INSERT on the request path.
+        
+        Rows are shipped to the record_audit_logs Celery task, which
+        bulk-inserts them on the worker. Rows buffered at one savepoint level
+        of a transaction travel in a single message sent when the outermost
+        transaction commits, and are dropped if that savepoint or the
+        transaction rolls back. Outside a transaction the row is shipped
+        immediately. created_at is stamped here, so worker lag does not
+        reorder the trail. ARTICLE entries also get ``article`` set.
+        """
+        if fields.get('entity_type') == 'ARTICLE':
+            fields.setdefault('article_id', fields['entity_id'])
+        log = cls(**fields)
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            _ship([log])
+            return log
+        
+        # One batch per connection and savepoint level, whose flush hook is
+        # registered at that level. Only the hook holds the batch (the map is
+        # weak), so when a rollback of the transaction or of a savepoint makes
+        # Django drop the hook, the batch and its rows go with it.
+        batches = getattr(_buffer, 'batches', None)
+        if batches is None:
+            batches = _buffer.batches = weakref.WeakValueDictionary()
+        key = (connection.alias, tuple(connection.savepoint_ids))
+        batch = batches.get(key)
+        if batch is None or batch.logs is None:
+            batch = batches[key] = _AuditBatch()
+            transaction.on_commit(batch.flush, using=connection.alias)
+        
+        batch.logs.append(log)
+        return log
+    
     def __str__(self):
         actor_name = self.actor.email if self.actor else 'SYSTEM'
         return f"{actor_name} - {self.action} - {self.entity_type}#{self.entity_id}"
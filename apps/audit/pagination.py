@@ -0,0 +1,17 @@
+"""
+Pagination for audit logs.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class AuditLogCursorPagination(CursorPagination):
+    """
+    Cursor pagination over an entity's audit trail, oldest first.
+    
+    Pages are fetched by seeking past the last ``created_at`` seen, so the
+    cost of a page does not grow with the length of the trail.
+    """
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+    ordering = ('created_at', 'id')
@@ -10,6 +10,12 @@ from apps.accounts.serializers import UserSerializer
 
 class AuditLogSerializer(serializers.ModelSerializer):
     """Serializer for AuditLog."""
+    # Columns read by this serializer, for .only() on querysets selecting the actor.
+    ONLY = (
+        'id', 'action', 'entity_type', 'entity_id', 'metadata', 'created_at',
+        'actor__email', 'actor__first_name', 'actor__last_name',
+    )
+    
     actor_email = serializers.EmailField(source='actor.email', read_only=True, allow_null=True)
     actor_name = serializers.SerializerMethodField()
     
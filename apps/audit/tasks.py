@@ -0,0 +1,28 @@
+"""
+Celery tasks for audit logging.
+"""
+from celery import shared_task
+from django.db import DatabaseError
+
+from .models import AUDIT_BUFFER_BATCH_SIZE, AuditLog
+
+
+@shared_task(
+    acks_late=True,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    max_retries=10
+)
+def record_audit_logs(rows):
+    """
+    Insert a batch of audit rows shipped by AuditLog.buffer().
+    
+    The message is acknowledged only after the insert, and database errors
+    are retried with backoff, so a worker crash or database outage does not
+    drop the batch. bulk_create() is atomic, so a retry never duplicates
+    part of a batch.
+    """
+    AuditLog.objects.bulk_create(
+        [AuditLog(**row) for row in rows],
+        batch_size=AUDIT_BUFFER_BATCH_SIZE
+    )
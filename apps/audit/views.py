@@ -16,7 +16,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     
     - Admins only: Read-only access
     """
-    queryset = AuditLog.objects.select_related('actor').all()
+    queryset = AuditLog.objects.select_related('actor').only(*AuditLogSerializer.ONLY)
     serializer_class = AuditLogSerializer
     permission_classes = [IsAdmin]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -4,4 +4,6 @@ from django.apps import AppConfig
 class CertificatesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.certificates'
-
+    
+    def ready(self):
+        import apps.certificates.signals  # noqa
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:22
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certificates', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='certificate',
+            name='certificate_certifi_a0a669_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='certificate',
+            name='certificate_article_13028f_idx',
+        ),
+    ]
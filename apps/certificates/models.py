@@ -3,6 +3,7 @@ Certificate models.
 """
 from django.db import models
 from django.core.exceptions import ValidationError
+from functools import partial
 import uuid
 
 
@@ -60,10 +61,10 @@ class Certificate(models.Model):
     class Meta:
         db_table = 'certificates'
         ordering = ['-issued_at']
+        # certificate_id (unique) and article (one-to-one) already have
+        # unique indexes
         indexes = [
-            models.Index(fields=['certificate_id']),
             models.Index(fields=['status']),
-            models.Index(fields=['article']),
         ]
     
     def __str__(self):
@@ -78,8 +79,14 @@ class Certificate(models.Model):
             )
     
     def save(self, *args, **kwargs):
-        """Override save to enforce business rules."""
-        self.clean()
+        """
+        Override save to enforce business rules.
+        
+        The publication check applies when the certificate is issued; later
+        saves (PDF attachment) skip it and the article fetch it needs.
+        """
+        if self._state.adding:
+            self.clean()
         super().save(*args, **kwargs)
     
     def revoke(self, user, reason=''):
@@ -93,26 +100,44 @@ class Certificate(models.Model):
         if user.role != 'ADMIN':
             raise ValidationError("Only admins can revoke certificates.")
         
-        self.status = self.Status.REVOKED
+        from django.core.cache import cache
+        from django.db import transaction
         from django.utils import timezone
-        self.revoked_at = timezone.now()
+        from apps.audit.models import AuditLog
+        from .serializers import VERIFICATION_CACHE_KEY
+        
+        # Write only the revocation columns; save() would re-run clean() (an
+        # article query) and rewrite every column
+        revoked_at = timezone.now()
+        with transaction.atomic():
+            Certificate.objects.filter(pk=self.pk).update(
+                status=self.Status.REVOKED,
+                revoked_at=revoked_at,
+                revoked_by=user,
+                revocation_reason=reason
+            )
+            
+            # Log revocation (shipped with the commit)
+            AuditLog.buffer(
+                actor=user,
+                action='CERTIFICATE_REVOKED',
+                entity_type='CERTIFICATE',
+                entity_id=self.id,
+                metadata={
+                    'certificate_id': str(self.certificate_id),
+                    'article_submission_id': self.article.submission_id,
+                    'reason': reason
+                }
+            )
+            # update() sends no post_save, so drop the verification cache here
+            transaction.on_commit(
+                partial(cache.delete, VERIFICATION_CACHE_KEY.format(certificate_id=self.certificate_id))
+            )
+        
+        self.status = self.Status.REVOKED
+        self.revoked_at = revoked_at
         self.revoked_by = user
         self.revocation_reason = reason
-        self.save()
-        
-        # Log revocation
-        from apps.audit.models import AuditLog
-        AuditLog.objects.create(
-            actor=user,
-            action='CERTIFICATE_REVOKED',
-            entity_type='CERTIFICATE',
-            entity_id=self.id,
-            metadata={
-                'certificate_id': str(self.certificate_id),
-                'article_submission_id': self.article.submission_id,
-                'reason': reason
-            }
-        )
     
     @property
     def verification_url(self):
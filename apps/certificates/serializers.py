@@ -6,6 +6,13 @@ from .models import Certificate
 from apps.articles.serializers import ArticleListSerializer
 
 
+VERIFICATION_CACHE_KEY = 'ujmp:cert_verify:{certificate_id}'
+VERIFICATION_CACHE_TIMEOUT = 3600  # seconds
+
+# Formats issued_at like a declared DateTimeField (settings format, current timezone)
+_ISSUED_AT = serializers.DateTimeField()
+
+
 class CertificateSerializer(serializers.ModelSerializer):
     """Serializer for Certificate."""
     article = ArticleListSerializer(read_only=True)
@@ -26,6 +33,11 @@ class CertificateSerializer(serializers.ModelSerializer):
 
 class CertificateListSerializer(serializers.ModelSerializer):
     """Simplified serializer for certificate lists."""
+    ONLY = (
+        'id', 'certificate_id', 'status', 'issued_at', 'revoked_at',
+        'article__submission_id', 'article__title',
+    )
+    
     article_title = serializers.CharField(source='article.title', read_only=True)
     article_submission_id = serializers.CharField(source='article.submission_id', read_only=True)
     
@@ -39,6 +51,13 @@ class CertificateListSerializer(serializers.ModelSerializer):
 
 class CertificateVerificationSerializer(serializers.Serializer):
     """Serializer for certificate verification response."""
+    # Certificate columns (with the joined article and journal) read to build it
+    ONLY = (
+        'certificate_id', 'status', 'issued_at',
+        'article__title', 'article__submission_id', 'article__publication_date',
+        'article__publication_url', 'article__journal__name',
+    )
+    
     certificate_id = serializers.UUIDField()
     status = serializers.CharField()
     article_title = serializers.CharField()
@@ -48,4 +67,25 @@ class CertificateVerificationSerializer(serializers.Serializer):
     publication_url = serializers.URLField(allow_null=True)
     issued_at = serializers.DateTimeField()
     revoked = serializers.BooleanField()
+    
+    def to_representation(self, certificate):
+        """
+        Build the response straight from a Certificate loaded with ``ONLY``.
+        
+        The shape is fixed, so fields are written directly instead of going
+        through per-field dispatch; the declared fields document the schema.
+        """
+        article = certificate.article
+        publication_date = article.publication_date
+        return {
+            'certificate_id': str(certificate.certificate_id),
+            'status': certificate.status,
+            'article_title': article.title,
+            'article_submission_id': article.submission_id,
+            'journal_name': article.journal.name,
+            'publication_date': publication_date.isoformat() if publication_date else None,
+            'publication_url': article.publication_url,
+            'issued_at': _ISSUED_AT.to_representation(certificate.issued_at),
+            'revoked': certificate.status == Certificate.Status.REVOKED,
+        }
 
@@ -0,0 +1,53 @@
+"""
+Signals for certificate lifecycle events.
+"""
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.articles.models import Article
+from apps.journals.models import Journal
+from .models import Certificate
+from .serializers import VERIFICATION_CACHE_KEY
+
+
+# Article and journal columns shown in the public verification response
+VERIFIED_ARTICLE_FIELDS = frozenset({
+    'title', 'submission_id', 'publication_date', 'publication_url', 'journal',
+})
+VERIFIED_JOURNAL_FIELDS = frozenset({'name'})
+
+
+def _drop_verifications(certificates):
+    """Drop the cached verification responses of ``certificates`` once committed."""
+    keys = [
+        VERIFICATION_CACHE_KEY.format(certificate_id=certificate_id)
+        for certificate_id in certificates.values_list('certificate_id', flat=True)
+    ]
+    if keys:
+        transaction.on_commit(partial(cache.delete_many, keys))
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+def invalidate_verification(sender, instance, **kwargs):
+    """Drop the cached public verification response (status, revocation)."""
+    cache.delete(VERIFICATION_CACHE_KEY.format(certificate_id=instance.certificate_id))
+
+
+@receiver(post_save, sender=Article)
+def invalidate_article_verification(sender, instance, created, update_fields=None, **kwargs):
+    """Drop the cached verification of the article's certificate when shown columns change."""
+    if created or (update_fields is not None and not VERIFIED_ARTICLE_FIELDS.intersection(update_fields)):
+        return
+    _drop_verifications(Certificate.objects.filter(article=instance))
+
+
+@receiver(post_save, sender=Journal)
+def invalidate_journal_verifications(sender, instance, created, update_fields=None, **kwargs):
+    """Drop the cached verifications of the journal's certificates when its name may have changed."""
+    if created or (update_fields is not None and not VERIFIED_JOURNAL_FIELDS.intersection(update_fields)):
+        return
+    _drop_verifications(Certificate.objects.filter(article__journal=instance))
@@ -1,8 +1,13 @@
 """
 Celery tasks for certificate generation.
 """
+import tempfile
+from functools import partial
+
 from celery import shared_task
 from django.conf import settings
+from django.core.files import File
+from django.db import transaction
 from django.utils import timezone
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
@@ -16,9 +21,50 @@ from PIL import Image
 
 from .models import Certificate
 from apps.articles.models import Article
+from apps.articles.workflow import ArticleStatus
 from apps.audit.models import AuditLog
 
 
+# Paragraph styles are immutable once built; create them once per worker
+# process rather than on every certificate.
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_SAMPLE_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1E4FD8'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=18,
+    textColor=colors.HexColor('#2C2C2C'),
+    spaceAfter=20,
+    alignment=TA_CENTER
+)
+
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_SAMPLE_STYLES['BodyText'],
+    fontSize=12,
+    textColor=colors.HexColor('#2C2C2C'),
+    alignment=TA_LEFT,
+    spaceAfter=15
+)
+
+CERTIFICATE_ID_STYLE = ParagraphStyle(
+    'CertificateID',
+    parent=_SAMPLE_STYLES['BodyText'],
+    fontSize=10,
+    textColor=colors.HexColor('#666666'),
+    alignment=TA_CENTER
+)
+
+
 @shared_task
 def generate_certificate_pdf(certificate_id):
     """
@@ -35,69 +81,39 @@ def generate_certificate_pdf(certificate_id):
         if article.status != 'PUBLISHED':
             raise ValueError(f"Article {article.submission_id} is not published.")
         
-        # Create PDF buffer
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
         story = []
         
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1E4FD8'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=18,
-            textColor=colors.HexColor('#2C2C2C'),
-            spaceAfter=20,
-            alignment=TA_CENTER
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['BodyText'],
-            fontSize=12,
-            textColor=colors.HexColor('#2C2C2C'),
-            alignment=TA_LEFT,
-            spaceAfter=15
-        )
-        
         # Title
         story.append(Spacer(1, 40*mm))
         story.append(Paragraph(
             settings.CERTIFICATE_ISSUER_NAME,
-            title_style
+            TITLE_STYLE
         ))
         story.append(Spacer(1, 20*mm))
         
         # Certificate heading
-        story.append(Paragraph("Certificate of Publication", heading_style))
+        story.append(Paragraph("Certificate of Publication", HEADING_STYLE))
         story.append(Spacer(1, 30*mm))
         
         # Certificate content
         content = f"""
         This is to certify that the article entitled<br/><br/>
         <b>"{article.title}"</b><br/><br/>
-        by {', '.join([author.get('name', '') for author in article.authors[:3]])}<br/><br/>
+        by {', '.join(author.name for author in article.article_authors.all()[:3])}<br/><br/>
         has been published in<br/><br/>
         <b>{article.journal.name}</b><br/><br/>
         Submission ID: {article.submission_id}<br/>
         Publication Date: {article.publication_date.strftime('%B %d, %Y') if article.publication_date else 'N/A'}<br/>
         """
         
-        story.append(Paragraph(content, body_style))
+        story.append(Paragraph(content, BODY_STYLE))
         story.append(Spacer(1, 30*mm))
         
         # QR Code
         verification_url = certificate.verification_url
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
+        # A fixed mask pattern skips scoring all eight masks (the bulk of
+        # qrcode's encoding time); every mask yields a valid, scannable code
+        qr = qrcode.QRCode(version=1, box_size=10, border=5, mask_pattern=0)
         qr.add_data(verification_url)
         qr.make(fit=True)
         
@@ -115,53 +131,48 @@ def generate_certificate_pdf(certificate_id):
         # Certificate ID
         story.append(Paragraph(
             f"Certificate ID: {certificate.certificate_id}",
-            ParagraphStyle(
-                'CertificateID',
-                parent=styles['BodyText'],
-                fontSize=10,
-                textColor=colors.HexColor('#666666'),
-                alignment=TA_CENTER
-            )
+            CERTIFICATE_ID_STYLE
         ))
         
-        # Build PDF
-        doc.build(story)
-        
-        # Save PDF to certificate
-        buffer.seek(0)
-        certificate.pdf_file.save(
-            f'certificate-{certificate.certificate_id}.pdf',
-            buffer,
-            save=False
-        )
-        certificate.save()
-        
-        # Log certificate generation
-        AuditLog.objects.create(
-            actor=None,  # System action
-            action='CERTIFICATE_ISSUED',
-            entity_type='CERTIFICATE',
-            entity_id=certificate.id,
-            metadata={
-                'certificate_id': str(certificate.certificate_id),
-                'article_submission_id': article.submission_id
-            }
-        )
-        
-        # Update article status to CERTIFICATE_ISSUED
-        if article.status == 'PUBLISHED':
-            article.transition_status(
-                article.current_status_enum,
-                'SYSTEM',
-                user=None
+        # Build PDF into a temporary file and hand storage the open file, so
+        # the backend copies it in chunks instead of from a second in-memory
+        # copy of the document
+        with tempfile.TemporaryFile(suffix='.pdf') as pdf_buffer:
+            SimpleDocTemplate(pdf_buffer, pagesize=A4).build(story)
+            pdf_buffer.seek(0)
+            
+            # Save PDF to certificate
+            certificate.pdf_file.save(
+                f'certificate-{certificate.certificate_id}.pdf',
+                File(pdf_buffer),
+                save=False
             )
-            # Manually set to CERTIFICATE_ISSUED
-            article.status = 'CERTIFICATE_ISSUED'
-            article.save()
         
-        # Send email notification
-        from apps.notifications.tasks import send_certificate_ready_email
-        send_certificate_ready_email.delay(str(certificate.certificate_id))
+        # One transaction: the buffered audit rows (issuance and the status
+        # change) are shipped together when it commits
+        with transaction.atomic():
+            certificate.save(update_fields=['pdf_file'])
+            
+            # Log certificate generation
+            AuditLog.buffer(
+                actor=None,  # System action
+                action='CERTIFICATE_ISSUED',
+                entity_type='CERTIFICATE',
+                entity_id=certificate.id,
+                metadata={
+                    'certificate_id': str(certificate.certificate_id),
+                    'article_submission_id': article.submission_id
+                }
+            )
+            
+            # Update article status to CERTIFICATE_ISSUED (SYSTEM transition)
+            article.transition_status(ArticleStatus.CERTIFICATE_ISSUED, 'SYSTEM', user=None)
+            
+            # Send email notification
+            from apps.notifications.tasks import send_certificate_ready_email
+            transaction.on_commit(
+                partial(send_certificate_ready_email.delay, str(certificate.certificate_id))
+            )
         
         return f"Certificate generated successfully: {certificate.certificate_id}"
         
@@ -180,20 +191,20 @@ def auto_generate_certificate(article_id):
         article_id: ID of the published article
     """
     try:
-        article = Article.objects.get(id=article_id)
+        # Only what the publication check, Certificate.clean() and the
+        # messages read
+        article = Article.objects.only('id', 'status', 'submission_id').get(id=article_id)
         
         if article.status != 'PUBLISHED':
             return f"Article {article.submission_id} is not published."
         
-        # Check if certificate already exists
-        if hasattr(article, 'certificate'):
-            return f"Certificate already exists for article {article.submission_id}"
-        
-        # Create certificate
-        certificate = Certificate.objects.create(
+        # Create certificate; a repeated publish finds the existing one
+        certificate, created = Certificate.objects.get_or_create(
             article=article,
-            status=Certificate.Status.ACTIVE
+            defaults={'status': Certificate.Status.ACTIVE}
         )
+        if not created:
+            return f"Certificate already exists for article {article.submission_id}"
         
         # Generate PDF
         generate_certificate_pdf.delay(str(certificate.certificate_id))
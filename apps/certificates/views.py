@@ -1,13 +1,15 @@
 """
 API views for certificates.
 """
+import uuid
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
-from django.shortcuts import get_object_or_404
+from django.core.cache import cache
 from django.http import FileResponse
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
@@ -16,7 +18,9 @@ from .models import Certificate
 from .serializers import (
     CertificateSerializer,
     CertificateListSerializer,
-    CertificateVerificationSerializer
+    CertificateVerificationSerializer,
+    VERIFICATION_CACHE_KEY,
+    VERIFICATION_CACHE_TIMEOUT,
 )
 from apps.accounts.permissions import IsAuthor, IsAdmin
 from apps.articles.models import Article
@@ -30,7 +34,10 @@ class CertificateViewSet(viewsets.ReadOnlyModelViewSet):
     - Authors: Can view their own certificates
     - Admins: Can view all certificates and revoke
     """
-    queryset = Certificate.objects.select_related('article').all()
+    # CertificateSerializer nests the article with its journal and author
+    queryset = Certificate.objects.select_related(
+        'article__journal', 'article__corresponding_author'
+    )
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status']
     search_fields = ['certificate_id', 'article__submission_id', 'article__title']
@@ -46,12 +53,20 @@ class CertificateViewSet(viewsets.ReadOnlyModelViewSet):
         """Filter based on user role."""
         user = self.request.user
         
+        if self.action == 'list':
+            # List rows read a handful of certificate/article columns only
+            queryset = Certificate.objects.select_related('article').only(
+                *CertificateListSerializer.ONLY
+            )
+        else:
+            queryset = self.queryset
+        
         if user.role == 'AUTHOR':
             # Authors see only certificates for their articles
-            return self.queryset.filter(article__corresponding_author=user)
+            return queryset.filter(article__corresponding_author=user)
         elif user.role == 'ADMIN':
             # Admins see all certificates
-            return self.queryset
+            return queryset
         
         return Certificate.objects.none()
     
@@ -62,7 +77,7 @@ class CertificateViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Check permissions
         if request.user.role == 'AUTHOR':
-            if certificate.article.corresponding_author != request.user:
+            if certificate.article.corresponding_author_id != request.user.pk:
                 return Response(
                     {'error': 'You can only download your own certificates.'},
                     status=status.HTTP_403_FORBIDDEN
@@ -124,26 +139,35 @@ class CertificateVerificationViewSet(viewsets.ViewSet):
     )
     @action(detail=False, methods=['get'], url_path='(?P<certificate_id>[^/.]+)')
     def verify(self, request, certificate_id=None):
-        """Verify certificate by ID."""
+        """
+        Verify certificate by ID.
+        
+        Responses are cached per certificate; saving or deleting a
+        certificate, or editing its article or journal, drops the entry
+        (see signals).
+        """
         try:
-            certificate = get_object_or_404(Certificate, certificate_id=certificate_id)
-            
-            serializer = CertificateVerificationSerializer({
-                'certificate_id': certificate.certificate_id,
-                'status': certificate.status,
-                'article_title': certificate.article.title,
-                'article_submission_id': certificate.article.submission_id,
-                'journal_name': certificate.article.journal.name,
-                'publication_date': certificate.article.publication_date,
-                'publication_url': certificate.article.publication_url,
-                'issued_at': certificate.issued_at,
-                'revoked': certificate.status == Certificate.Status.REVOKED
-            })
-            
-            return Response(serializer.data)
-        except Exception as e:
+            certificate_id = uuid.UUID(certificate_id)
+        except ValueError:
             return Response(
                 {'error': 'Certificate not found or invalid.'},
                 status=status.HTTP_404_NOT_FOUND
             )
-
+        
+        cache_key = VERIFICATION_CACHE_KEY.format(certificate_id=certificate_id)
+        data = cache.get(cache_key)
+        if data is None:
+            try:
+                certificate = Certificate.objects.select_related('article__journal').only(
+                    *CertificateVerificationSerializer.ONLY
+                ).get(certificate_id=certificate_id)
+            except Certificate.DoesNotExist:
+                return Response(
+                    {'error': 'Certificate not found or invalid.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            data = CertificateVerificationSerializer().to_representation(certificate)
+            cache.set(cache_key, data, VERIFICATION_CACHE_TIMEOUT)
+        
+        return Response(data)
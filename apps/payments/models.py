@@ -1,7 +1,9 @@
 """
 Payment and invoice models.
 """
-from django.db import models
+from functools import partial
+
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 import uuid
@@ -80,12 +82,18 @@ class Invoice(models.Model):
     def __str__(self):
         return f"Invoice {self.invoice_number} - {self.article.submission_id}"
     
+    @staticmethod
+    def generate_invoice_number() -> str:
+        """Generate a unique invoice identifier."""
+        return f"INV-{uuid.uuid4().hex[:12].upper()}"
+    
     def save(self, *args, **kwargs):
         """Generate invoice number if not set."""
         if not self.invoice_number:
-            self.invoice_number = f"INV-{uuid.uuid4().hex[:12].upper()}"
+            self.invoice_number = self.generate_invoice_number()
         super().save(*args, **kwargs)
     
+    @transaction.atomic
     def mark_as_paid(self, provider_transaction_id=None, payment_provider=None, user=None):
         """
         Mark invoice as paid.
@@ -126,9 +134,9 @@ class Invoice(models.Model):
                 }
             )
         
-        # Send email notification
+        # Send email notification once the payment is committed
         from apps.notifications.tasks import send_payment_confirmation_email
-        send_payment_confirmation_email.delay(self.id)
+        transaction.on_commit(partial(send_payment_confirmation_email.delay, self.id))
 
 
 class Payment(models.Model):
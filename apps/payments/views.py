@@ -21,6 +21,10 @@ from apps.accounts.permissions import IsAuthor, IsAdmin, IsReviewerOrAdmin
 from apps.articles.models import Article
 
 
+# Roles allowed to see every invoice.
+_STAFF_ROLES = frozenset({'REVIEWER', 'ADMIN'})
+
+
 class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for invoices.
@@ -47,7 +51,7 @@ class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
         if user.role == 'AUTHOR':
             # Authors see only invoices for their articles
             return self.queryset.filter(article__corresponding_author=user)
-        elif user.role in ['REVIEWER', 'ADMIN']:
+        elif user.role in _STAFF_ROLES:
             # Reviewers and admins see all invoices
             return self.queryset
         
@@ -69,6 +69,19 @@ class JWTAuthenticationTests(TestCase):
         except Exception as e:
             self.fail(f"Token decoding failed: {e}")
     
+    def test_jwt_claims_refreshed_after_role_change(self):
+        """Test that cached token claims are invalidated when the user changes."""
+        from apps.accounts.serializers import CustomTokenObtainPairSerializer
+        
+        token = CustomTokenObtainPairSerializer.get_token(self.user)
+        self.assertEqual(token['role'], 'AUTHOR')
+        
+        self.user.role = 'REVIEWER'
+        self.user.save()
+        
+        token = CustomTokenObtainPairSerializer.get_token(self.user)
+        self.assertEqual(token['role'], 'REVIEWER')
+    
     def test_access_token_required(self):
         """Test that protected endpoints require access token."""
         response = self.client.get('/api/articles/')
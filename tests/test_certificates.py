@@ -96,6 +96,21 @@ class CertificateVerificationTests(TestCase):
         self.assertEqual(response.data['publication_date'], str(self.article.publication_date))
         self.assertEqual(response.data['journal_name'], self.journal.name)
     
+    def test_verification_reflects_article_and_journal_edits(self):
+        """Test that editing the article or journal drops the cached verification response."""
+        url = f'/verify/certificate/{self.certificate.certificate_id}/'
+        self.client.get(url)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.title = 'Corrected Title'
+            self.article.save(update_fields=['title'])
+        self.assertEqual(self.client.get(url).data['article_title'], 'Corrected Title')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.journal.name = 'Renamed Journal'
+            self.journal.save()
+        self.assertEqual(self.client.get(url).data['journal_name'], 'Renamed Journal')
+    
     def test_certificate_download_requires_auth(self):
         """Test that certificate download requires authentication."""
         response = self.client.get(f'/api/certificates/{self.certificate.id}/download/')
@@ -113,4 +128,18 @@ class CertificateVerificationTests(TestCase):
         
         # May return 404 if PDF not generated, but should not be 403
         self.assertNotEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_certificate_detail_nests_article(self):
+        """Test that certificate detail includes the article summary."""
+        from rest_framework_simplejwt.tokens import RefreshToken
+        
+        refresh = RefreshToken.for_user(self.author)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(refresh.access_token)}')
+        
+        response = self.client.get(f'/api/certificates/{self.certificate.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['article']['submission_id'], 'SUB-001')
+        self.assertEqual(response.data['article']['journal']['name'], self.journal.name)
+        self.assertEqual(response.data['article']['corresponding_author_email'], self.author.email)
 
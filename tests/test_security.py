@@ -70,4 +70,21 @@ class SecurityTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # DRF serializers escape HTML by default, so this should be safe
         self.assertIn('script', response.data['title'])  # Escaped, not executed
-
+    
+    def test_counter_throttle_limits_each_window(self):
+        """Test that the fixed-window throttle allows num_requests per window, then refuses."""
+        from django.contrib.auth.models import AnonymousUser
+        from django.core.cache import cache
+        from rest_framework.test import APIRequestFactory
+        from apps.articles.throttling import PublicAPIRateThrottle
+        
+        class ThreePerHourThrottle(PublicAPIRateThrottle):
+            rate = '3/hour'
+        
+        cache.clear()
+        request = APIRequestFactory().get('/api/certificates/verify/')
+        request.user = AnonymousUser()
+        
+        allowed = [ThreePerHourThrottle().allow_request(request, None) for _ in range(4)]
+        
+        self.assertEqual(allowed, [True, True, True, False])
@@ -1,15 +1,22 @@
 """
 System-level tests for workflow state machine and bypass prevention.
 """
+from unittest import mock
+
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, transaction
 from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.core.exceptions import ValidationError
 
-from apps.articles.models import Article
+from apps.articles.models import Article, Review
+from apps.articles.services import ArticleWorkflowService
 from apps.articles.workflow import ArticleStatus
+from apps.audit.models import AuditLog
+from apps.audit.tasks import record_audit_logs
 from apps.journals.models import Journal
 
 User = get_user_model()
@@ -35,6 +42,13 @@ class WorkflowBypassPreventionTests(TestCase):
             role='REVIEWER'
         )
         
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            username='admin',
+            password='pass123',
+            role='ADMIN'
+        )
+        
         self.journal = Journal.objects.create(
             name='Test Journal',
             issn='1234-5678',
@@ -52,6 +66,16 @@ class WorkflowBypassPreventionTests(TestCase):
             status=ArticleStatus.DRAFT.value
         )
     
+    def _make_article(self, article_status):
+        """Create another article by the test author in ``article_status``."""
+        return Article.objects.create(
+            title='Another Article',
+            abstract='Test abstract',
+            corresponding_author=self.author,
+            journal=self.journal,
+            status=article_status.value
+        )
+    
     def test_author_cannot_bypass_submission(self):
         """Test that author cannot directly set status to UNDER_REVIEW."""
         refresh = RefreshToken.for_user(self.author)
@@ -159,4 +183,197 @@ class WorkflowBypassPreventionTests(TestCase):
         })
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
+    
+    def test_submission_id_collision_retried(self):
+        """Test that a colliding generated submission_id is regenerated on insert."""
+        ids = iter(['SUB-001', 'SUB-002'])
+        with mock.patch('apps.articles.models.generate_submission_id', side_effect=lambda: next(ids)):
+            article = Article.objects.create(
+                title='Another Article',
+                abstract='Test abstract',
+                corresponding_author=self.author,
+                journal=self.journal,
+            )
+        
+        self.assertEqual(article.submission_id, 'SUB-002')
+    
+    def test_other_integrity_errors_not_retried(self):
+        """Test that an integrity error other than a submission_id collision is raised at once."""
+        with mock.patch(
+            'apps.articles.models.generate_submission_id', return_value='SUB-NEW'
+        ) as generate:
+            with self.assertRaises(IntegrityError):
+                Article.objects.create(
+                    title=None,
+                    abstract='Test abstract',
+                    corresponding_author=self.author,
+                    journal=self.journal,
+                )
+        
+        self.assertEqual(generate.call_count, 1)
+    
+    def test_set_authors_refreshes_search_vector(self):
+        """Test that replacing the byline re-indexes the article for admin search."""
+        with mock.patch.object(Article, 'refresh_search_vector') as refresh:
+            self.article.set_authors([{'name': 'Ada Lovelace'}])
+        
+        refresh.assert_called_once_with()
+        self.assertEqual(list(self.article.article_authors.values_list('name', flat=True)), ['Ada Lovelace'])
+    
+    def test_transition_audit_rows_written_on_commit(self):
+        """Test that buffered audit rows are bulk-inserted once the transaction commits."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.article.transition_status(ArticleStatus.SUBMITTED, 'AUTHOR', self.author)
+            self.article.transition_status(ArticleStatus.UNDER_REVIEW, 'ADMIN')
+        
+        self.assertFalse(AuditLog.objects.filter(entity_id=self.article.id).exists())
+        
+        # Run the task in-process whatever the Celery configuration
+        with mock.patch.object(record_audit_logs, 'delay', side_effect=record_audit_logs) as delay:
+            with CaptureQueriesContext(connection) as queries:
+                for callback in callbacks:
+                    callback()
+        
+        delay.assert_called_once()
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(AuditLog.objects.filter(entity_id=self.article.id).count(), 2)
+    
+    def test_transition_audit_rows_written_inline_without_broker(self):
+        """Test that audit rows are inserted directly when the task cannot be sent."""
+        with mock.patch.object(record_audit_logs, 'delay', side_effect=ConnectionError):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.article.transition_status(ArticleStatus.SUBMITTED, 'AUTHOR', self.author)
+        
+        self.assertEqual(AuditLog.objects.filter(entity_id=self.article.id).count(), 1)
+    
+    def test_audit_rows_from_rolled_back_savepoint_dropped(self):
+        """Test that rows buffered in a rolled-back savepoint are not shipped."""
+        def log(action):
+            AuditLog.buffer(
+                actor=self.author,
+                action=action,
+                entity_type='ARTICLE',
+                entity_id=self.article.id,
+                metadata={}
+            )
+        
+        with mock.patch.object(record_audit_logs, 'delay', side_effect=record_audit_logs):
+            with self.captureOnCommitCallbacks(execute=True):
+                log(AuditLog.ActionType.ARTICLE_SUBMITTED)
+                try:
+                    with transaction.atomic():
+                        log(AuditLog.ActionType.ADMIN_OVERRIDE)
+                        raise ValidationError('rolled back')
+                except ValidationError:
+                    pass
+                log(AuditLog.ActionType.STATUS_CHANGE)
+        
+        self.assertEqual(
+            sorted(AuditLog.objects.filter(article_id=self.article.id).values_list('action', flat=True)),
+            [AuditLog.ActionType.ARTICLE_SUBMITTED, AuditLog.ActionType.STATUS_CHANGE]
+        )
+    
+    def test_concurrent_transition_rejected(self):
+        """Test that a transition from a stale status does not overwrite a newer one."""
+        stale = Article.objects.get(pk=self.article.pk)
+        self.article.transition_status(ArticleStatus.SUBMITTED, 'AUTHOR', self.author)
+        
+        with self.assertRaises(ValidationError):
+            stale.transition_status(ArticleStatus.SUBMITTED, 'AUTHOR', self.author)
+        
+        self.assertEqual(stale.status, ArticleStatus.DRAFT.value)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.status, ArticleStatus.DESK_CHECK.value)
+    
+    def test_bulk_desk_reject_skips_ineligible_articles(self):
+        """Test that bulk desk reject only rejects desk-rejectable articles."""
+        desk_check = self._make_article(ArticleStatus.DESK_CHECK)
+        
+        refresh = RefreshToken.for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(refresh.access_token)}')
+        response = self.client.post('/api/articles/bulk_desk_reject/', {
+            'article_ids': [desk_check.id, self.article.id],
+            'comments': 'Out of scope'
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rejected'], [desk_check.id])
+        self.assertEqual(response.data['skipped'], [self.article.id])
+        desk_check.refresh_from_db()
+        self.article.refresh_from_db()
+        self.assertEqual(desk_check.status, ArticleStatus.REJECTED.value)
+        self.assertEqual(self.article.status, ArticleStatus.DRAFT.value)
+    
+    def test_desk_reject_with_existing_review_raises_validation_error(self):
+        """Test that a second decision by the same user is a ValidationError, not an IntegrityError."""
+        article = self._make_article(ArticleStatus.DESK_CHECK)
+        Review.objects.create(
+            article=article,
+            reviewer=self.admin,
+            recommendation='REVISE',
+            comments_to_author='Earlier decision'
+        )
+        
+        with self.assertRaises(ValidationError):
+            ArticleWorkflowService.desk_reject(article, self.admin, 'Out of scope')
+        
+        article.refresh_from_db()
+        self.assertEqual(article.status, ArticleStatus.DESK_CHECK.value)
+        self.assertEqual(
+            Review.objects.get(article=article, reviewer=self.admin).comments_to_author,
+            'Earlier decision'
+        )
+    
+    def test_bulk_accept_skips_articles_already_reviewed_by_user(self):
+        """Test that bulk accept leaves an article with the admin's earlier review untouched."""
+        reviewed = self._make_article(ArticleStatus.UNDER_REVIEW)
+        fresh = self._make_article(ArticleStatus.UNDER_REVIEW)
+        Review.objects.create(
+            article=reviewed,
+            reviewer=self.admin,
+            recommendation='REVISE',
+            comments_to_author='Earlier decision'
+        )
+        
+        accepted = ArticleWorkflowService.accept_many([reviewed.id, fresh.id], self.admin)
+        
+        self.assertEqual(accepted, [fresh.id])
+        reviewed.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(reviewed.status, ArticleStatus.UNDER_REVIEW.value)
+        self.assertEqual(fresh.status, ArticleStatus.ACCEPTED.value)
+        self.assertEqual(
+            Review.objects.get(article=reviewed, reviewer=self.admin).comments_to_author,
+            'Earlier decision'
+        )
+    
+    def test_bulk_desk_reject_skips_articles_already_reviewed_by_user(self):
+        """Test that bulk desk reject leaves an article with the admin's earlier review untouched."""
+        reviewed = self._make_article(ArticleStatus.DESK_CHECK)
+        fresh = self._make_article(ArticleStatus.DESK_CHECK)
+        Review.objects.create(
+            article=reviewed,
+            reviewer=self.admin,
+            recommendation='REVISE',
+            comments_to_author='Earlier decision'
+        )
+        
+        refresh = RefreshToken.for_user(self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(refresh.access_token)}')
+        response = self.client.post('/api/articles/bulk_desk_reject/', {
+            'article_ids': [reviewed.id, fresh.id],
+            'comments': 'Out of scope'
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rejected'], [fresh.id])
+        self.assertEqual(response.data['skipped'], [reviewed.id])
+        reviewed.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(reviewed.status, ArticleStatus.DESK_CHECK.value)
+        self.assertEqual(fresh.status, ArticleStatus.REJECTED.value)
+        self.assertEqual(
+            Review.objects.get(article=reviewed, reviewer=self.admin).comments_to_author,
+            'Earlier decision'
+        )